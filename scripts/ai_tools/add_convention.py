@@ -13,6 +13,9 @@ from scripts.ai_tools.utils import (
     write_context_file,
 )
 
+# Section headings in CONVENTIONS.md
+_SECTION_RE = re.compile(r"##\s+([^\n]+)")
+
 
 def extract_sections(content: str) -> list[str]:
     """Extract section names from conventions file.
@@ -23,14 +26,7 @@ def extract_sections(content: str) -> list[str]:
     Returns:
         List of section names
     """
-    sections = []
-    pattern = r"##\s+([^\n]+)"
-    matches = re.findall(pattern, content)
-
-    for match in matches:
-        sections.append(match.strip())
-
-    return sections
+    return [match.strip() for match in _SECTION_RE.findall(content)]
 
 
 def format_convention_entry(
@@ -150,11 +146,12 @@ def add_convention(
     section_match = re.search(section_pattern, conventions_content, re.DOTALL)
 
     if section_match:
-        # Section exists - append to it
-        section_content = section_match.group(1)
-        new_section = section_content + new_entry
-
-        conventions_content = conventions_content.replace(section_content, new_section)
+        # Section exists - splice the entry in at the end of the match, so
+        # the file is not rescanned and only this section is touched
+        end = section_match.end(1)
+        conventions_content = (
+            conventions_content[:end] + new_entry + conventions_content[end:]
+        )
     else:
         # Section doesn't exist - create it
         new_section = f"## {section}\n\n{new_entry}"
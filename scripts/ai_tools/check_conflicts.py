@@ -80,7 +80,7 @@ def check_conflicts(task_name: str | None = None) -> None:
         print_success("No active tasks file found - no conflicts!")
         return
 
-    content = active_tasks_file.read_text()
+    content = active_tasks_file.read_text(encoding="utf-8")
 
     # Extract tasks from different sections
     in_progress = extract_tasks(content, "In Progress")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import re
+from itertools import islice
 
 from scripts.ai_tools.utils import (
     get_recent_sessions,
@@ -11,6 +12,53 @@ from scripts.ai_tools.utils import (
     read_context_file,
 )
 
+# Task bullets inside an ACTIVE_TASKS.md section
+_TASK_BULLET_RE = re.compile(r"^\s*[-*]\s+", re.MULTILINE)
+
+# Decision headers in RECENT_DECISIONS.md, and whole decision blocks
+_DECISION_HEADER_RE = re.compile(r"##\s+\[([\d\-: ]+)\]\s+([^\n]+)")
+_DECISION_BLOCK_RE = re.compile(r"(##\s+\[[\d\-: ]+\].*?)(?=##|$)", re.DOTALL)
+
+# Level-2 and level-3 headings in CONVENTIONS.md
+_SECTION_HEADING_RE = re.compile(r"##\s+([^\n]+)")
+_CONVENTION_HEADING_RE = re.compile(r"###\s+([^\n]+)")
+
+# Fields of LAST_SESSION_SUMMARY.md
+_SESSION_ID_RE = re.compile(r"\*\*Session ID\*\*:\s*(\d+)")
+_SESSION_DATE_RE = re.compile(r"\*\*Date\*\*:\s*([^\n]+)")
+_SESSION_SUMMARY_RE = re.compile(r"##\s+Summary\s*\n([^\n]+)")
+_SESSION_STATUS_RE = re.compile(r"\*\*Status\*\*:\s*([^\n]+)")
+
+
+def _slice_section(content: str, section: str) -> str | None:
+    """Slice the body of a "## <section>" heading out of the content.
+
+    Plain ``str.find`` calls replace a lazy DOTALL regex; the body runs
+    from after the heading and any whitespace up to the next "##".
+
+    Args:
+        content: Content of ACTIVE_TASKS.md
+        section: Section name (e.g., "In Progress", "Blocked")
+
+    Returns:
+        The section body, or None if the heading is absent
+    """
+    heading = f"## {section}"
+    start = content.find(heading)
+    if start == -1:
+        return None
+
+    # Skip the whitespace after the heading, as the section regex did
+    start += len(heading)
+    while start < len(content) and content[start].isspace():
+        start += 1
+
+    end = content.find("##", start)
+    if end == -1:
+        # Like the regex's "$", stop before a final newline
+        end = len(content) - content.endswith("\n")
+    return content[start:end]
+
 
 def count_tasks_in_section(content: str, section: str) -> int:
     """Count tasks in a specific section of ACTIVE_TASKS.md.
@@ -23,16 +71,13 @@ def count_tasks_in_section(content: str, section: str) -> int:
         Number of tasks in section
     """
     # Find the section
-    pattern = rf"## {re.escape(section)}\s*(.*?)(?=##|$)"
-    match = re.search(pattern, content, re.DOTALL)
+    section_content = _slice_section(content, section)
 
-    if not match:
+    if section_content is None:
         return 0
 
-    section_content = match.group(1)
-
     # Count bullet points (tasks)
-    tasks = re.findall(r"^\s*[-*]\s+", section_content, re.MULTILINE)
+    tasks = _TASK_BULLET_RE.findall(section_content)
     return len(tasks)
 
 
@@ -46,15 +91,10 @@ def extract_recent_decisions(content: str, count: int = 3) -> list[str]:
     Returns:
         List of decision summaries
     """
-    # Find all decision headers
-    pattern = r"##\s+\[([\d\-: ]+)\]\s+([^\n]+)"
-    matches = re.findall(pattern, content)
+    # Find the first count decision headers; the scan stops there
+    matches = islice(_DECISION_HEADER_RE.finditer(content), count)
 
-    decisions = []
-    for timestamp, title in matches[:count]:
-        decisions.append(f"[{timestamp}] {title}")
-
-    return decisions
+    return [f"[{match.group(1)}] {match.group(2)}" for match in matches]
 
 
 def extract_key_conventions(content: str) -> list[str]:
@@ -66,17 +106,11 @@ def extract_key_conventions(content: str) -> list[str]:
     Returns:
         List of convention summaries
     """
-    conventions = []
-
-    # Find all level-3 headers (###) which are individual conventions
-    pattern = r"###\s+([^\n]+)"
-    matches = re.findall(pattern, content)
+    # Find level-3 headers (###), which are individual conventions, and
+    # take the first 5 without scanning the rest of the file
+    matches = islice(_CONVENTION_HEADING_RE.finditer(content), 5)
 
-    # Take first 5 conventions
-    for title in matches[:5]:
-        conventions.append(title.strip())
-
-    return conventions
+    return [match.group(1).strip() for match in matches]
 
 
 def get_last_session_summary(content: str) -> dict[str, str]:
@@ -96,23 +130,27 @@ def get_last_session_summary(content: str) -> dict[str, str]:
         "files": "",
     }
 
+    # Four literal-prefixed searches beat one alternation over finditer:
+    # each search jumps straight to its "**Label**" prefix, while the
+    # combined pattern has no literal prefix for the engine to skip to
+
     # Extract session ID
-    match = re.search(r"\*\*Session ID\*\*:\s*(\d+)", content)
+    match = _SESSION_ID_RE.search(content)
     if match:
         info["session_id"] = match.group(1)
 
     # Extract date
-    match = re.search(r"\*\*Date\*\*:\s*([^\n]+)", content)
+    match = _SESSION_DATE_RE.search(content)
     if match:
         info["date"] = match.group(1)
 
     # Extract summary (look for ## Summary section)
-    match = re.search(r"##\s+Summary\s*\n([^\n]+)", content)
+    match = _SESSION_SUMMARY_RE.search(content)
     if match:
         info["summary"] = match.group(1).strip()
 
     # Extract status line
-    match = re.search(r"\*\*Status\*\*:\s*([^\n]+)", content)
+    match = _SESSION_STATUS_RE.search(content)
     if match:
         info["status"] = match.group(1)
 
@@ -127,14 +165,11 @@ def show_context_summary(detailed: bool = False) -> None:
     """
     print_header("📚 AI Context Summary")
 
-    # Read context files
-    last_session = read_context_file("LAST_SESSION_SUMMARY.md")
-    active_tasks = read_context_file("ACTIVE_TASKS.md")
-    recent_decisions = read_context_file("RECENT_DECISIONS.md")
-    conventions = read_context_file("CONVENTIONS.md")
+    # Each context file is read just before its section is printed
 
     # Display last session
     print("📝 Last Session:")
+    last_session = read_context_file("LAST_SESSION_SUMMARY.md")
     if last_session and "No sessions yet" not in last_session:
         session_info = get_last_session_summary(last_session)
         if session_info["date"]:
@@ -152,6 +187,7 @@ def show_context_summary(detailed: bool = False) -> None:
 
     # Display active tasks
     print("🚧 Active Tasks:")
+    active_tasks = read_context_file("ACTIVE_TASKS.md")
     if active_tasks:
         in_progress = count_tasks_in_section(active_tasks, "In Progress")
         blocked = count_tasks_in_section(active_tasks, "Blocked")
@@ -166,21 +202,22 @@ def show_context_summary(detailed: bool = False) -> None:
             print()
             sections = ["In Progress", "Blocked"]
             for section in sections:
-                pattern = rf"## {re.escape(section)}\s*(.*?)(?=##|$)"
-                match = re.search(pattern, active_tasks, re.DOTALL)
-                if match:
-                    section_content = match.group(1).strip()
+                section_body = _slice_section(active_tasks, section)
+                if section_body is not None:
+                    section_content = section_body.strip()
                     if section_content:
                         print(f"\n  {section}:")
                         for line in section_content.split("\n"):
-                            if line.strip().startswith(("-", "*")):
-                                print(f"    {line.strip()}")
+                            task = line.strip()
+                            if task.startswith(("-", "*")):
+                                print(f"    {task}")
     else:
         print("  No active tasks")
     print()
 
     # Display recent decisions
     print("🎯 Recent Decisions (Last 3):")
+    recent_decisions = read_context_file("RECENT_DECISIONS.md")
     if recent_decisions:
         decisions = extract_recent_decisions(recent_decisions, count=3)
         if decisions:
@@ -192,16 +229,17 @@ def show_context_summary(detailed: bool = False) -> None:
         if detailed and decisions:
             # Show full decision content
             print()
-            pattern = r"(##\s+\[[\d\-: ]+\].*?)(?=##|$)"
-            matches = re.findall(pattern, recent_decisions, re.DOTALL)
-            for match in matches[:3]:
-                print(f"\n{match.strip()}\n")
+            # Stop scanning after the third block instead of matching all
+            blocks = islice(_DECISION_BLOCK_RE.finditer(recent_decisions), 3)
+            for block in blocks:
+                print(f"\n{block.group(1).strip()}\n")
     else:
         print("  No decisions recorded")
     print()
 
     # Display key conventions
     print("📋 Key Conventions:")
+    conventions = read_context_file("CONVENTIONS.md")
     if conventions:
         conv_list = extract_key_conventions(conventions)
         if conv_list:
@@ -209,16 +247,16 @@ def show_context_summary(detailed: bool = False) -> None:
                 print(f"  • {conv}")
         else:
             # Fallback: show section headers
-            sections = re.findall(r"##\s+([^\n]+)", conventions)
-            for section in sections[:5]:
-                print(f"  • {section}")
+            headings = islice(_SECTION_HEADING_RE.finditer(conventions), 5)
+            for heading in headings:
+                print(f"  • {heading.group(1)}")
     else:
         print("  No conventions defined")
     print()
 
     # Display recent sessions
     print("📂 Recent Sessions:")
-    sessions = get_recent_sessions(5)
+    sessions = get_recent_sessions(5, with_content=False)
     if sessions:
         for i, session in enumerate(sessions, 1):
             session_id = session["session_id"]
@@ -314,9 +314,8 @@ def finish_task(
     assert execution_file is not None
 
     # Read files
-    plan_content = plan_file.read_text()
-    summary_file.read_text()
-    execution_content = execution_file.read_text()
+    plan_content = plan_file.read_text(encoding="utf-8")
+    execution_content = execution_file.read_text(encoding="utf-8")
 
     # Extract task name from file header
     task_name_match = re.search(r"# Task (?:Plan|Summary): (.+)", plan_content)
@@ -411,7 +410,7 @@ def finish_task(
 
     updated_summary += "\n---\n\n## Notes\n\n[Session complete]\n"
 
-    summary_file.write_text(updated_summary)
+    summary_file.write_text(updated_summary, encoding="utf-8")
 
     # Update LAST_SESSION_SUMMARY.md
     update_last_session_summary(session_id, task_name, updated_summary)
@@ -14,6 +14,14 @@ from scripts.ai_tools.utils import (
     print_success,
 )
 
+# Emoji shown in front of each log level
+_LEVEL_EMOJI = {
+    "info": "📝",
+    "warning": "⚠️ ",
+    "error": "❌",
+    "success": "✅",
+}
+
 
 def get_emoji_for_level(level: str) -> str:
     """Get emoji for log level.
@@ -24,13 +32,7 @@ def get_emoji_for_level(level: str) -> str:
     Returns:
         Emoji character
     """
-    emoji_map = {
-        "info": "📝",
-        "warning": "⚠️ ",
-        "error": "❌",
-        "success": "✅",
-    }
-    return emoji_map.get(level, "📝")
+    return _LEVEL_EMOJI.get(level, "📝")
 
 
 def check_log_specificity(message: str) -> list[str]:
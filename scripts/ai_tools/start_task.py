@@ -207,7 +207,7 @@ def display_context_summary() -> None:
             print(f"  ⚠️  {filename} (empty)")
 
     # Show recent sessions count
-    sessions = get_recent_sessions(5)
+    sessions = get_recent_sessions(5, with_content=False)
     print(f"  ✅ Last {len(sessions)} sessions reviewed")
 
 
@@ -273,9 +273,15 @@ def start_task(task_name: str, task_type: str = "feature") -> None:
     )
 
     # Write templates
-    plan_file.write_text(get_plan_template(session_id, task_name, task_type))
-    summary_file.write_text(get_summary_template(session_id, task_name))
-    execution_file.write_text(get_execution_template(session_id, task_name))
+    plan_file.write_text(
+        get_plan_template(session_id, task_name, task_type), encoding="utf-8"
+    )
+    summary_file.write_text(
+        get_summary_template(session_id, task_name), encoding="utf-8"
+    )
+    execution_file.write_text(
+        get_execution_template(session_id, task_name), encoding="utf-8"
+    )
 
     # Add to active tasks
     add_task_to_active(task_name, session_id)
@@ -6,28 +6,28 @@ information to auto-populate PLAN file sections.
 
 from __future__ import annotations
 
-import re
+import string
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
-from scripts.ai_tools.utils import read_context_file
+from scripts.ai_tools import utils
 
+# Extensions of explicit file names (*.py, *.md, etc.) mentioned in a task
+_FILE_EXTENSIONS = (".py", ".md", ".txt", ".yml", ".yaml", ".toml", ".json")
 
-def extract_objective_from_task_description(task_name: str) -> str:
-    """Extract and expand objective from task description.
-
-    Analyzes the task name and creates a clear, detailed objective
-    statement that describes what needs to be accomplished.
+# Characters allowed in the stem of an explicit file name
+_FILE_STEM_CHARS = frozenset(string.ascii_letters + string.digits + "_")
 
-    Args:
-        task_name: The task name/description provided by user
-
-    Returns:
-        Expanded objective statement
-    """
-    # Normalize task name
-    task_lower = task_name.lower().strip()
+# Punctuation stripped from the edges of a word before matching file names
+_EDGE_PUNCTUATION = string.punctuation.replace("_", "")
 
-    # Identify action verb
-    action_verbs = {
+# Leading task verb -> action used to open the objective statement
+_ACTION_VERBS = MappingProxyType(
+    {
         "add": "Implement",
         "create": "Create",
         "fix": "Resolve",
@@ -40,49 +40,368 @@ def extract_objective_from_task_description(task_name: str) -> str:
         "optimize": "Optimize",
         "enhance": "Enhance",
     }
+)
 
-    # Find the action verb in task name
-    action = "Implement"  # Default
-    for verb, replacement in action_verbs.items():
-        if task_lower.startswith(verb):
-            action = replacement
-            break
+# Task type -> guidance line for the PLAN context section
+_TASK_TYPE_CONTEXT = MappingProxyType(
+    {
+        "feature": "New functionality - ensure comprehensive tests and documentation.",
+        "bugfix": "Bug resolution - reproduce issue first, then fix with tests.",
+        "refactor": "Code improvement - maintain behavior, add tests if missing.",
+        "docs": "Documentation update - ensure accuracy and completeness.",
+    }
+)
+
+# Words that suggest the preceding word names a module/package
+_MODULE_INDICATORS = frozenset(
+    {
+        "module",
+        "package",
+        "component",
+        "service",
+        "handler",
+        "manager",
+        "controller",
+        "model",
+        "view",
+        "utils",
+        "helpers",
+    }
+)
+
+# Characters that already end a sentence
+_TERMINAL_PUNCTUATION = (".", "!", "?")
+
+# Maps every punctuation character except "_" to a space so a single
+# str.translate + str.split pass tokenizes a task description
+_SEPARATOR_TABLE = str.maketrans(
+    dict.fromkeys(string.punctuation.replace("_", ""), " ")
+)
+
+# Whole-word keywords used to add delivery notes and dependencies
+_TEST_KEYWORDS = frozenset({"test", "tests", "testing"})
+_SECURITY_KEYWORDS = frozenset({"authentication", "security", "auth"})
+_DATABASE_KEYWORDS = frozenset({"database", "migration"})
+_API_KEYWORDS = frozenset({"api", "endpoint", "integration"})
+
+# Whole-word keywords used to classify the task type
+_BUGFIX_KEYWORDS = frozenset({"fix", "fixes", "bug", "bugs", "error", "issue"})
+_REFACTOR_KEYWORDS = frozenset({"refactor", "improve", "optimize"})
+_DOCS_KEYWORDS = frozenset({"document", "documentation", "docs", "readme", "guide"})
+
+# Whole-word keywords used to estimate scope, in priority order
+_SCOPE_KEYWORDS = MappingProxyType(
+    {
+        "large": frozenset(
+            {"complete", "entire", "system", "rewrite", "migration", "overhaul"}
+        ),
+        "medium": frozenset(
+            {"module", "component", "service", "integration", "update"}
+        ),
+        "small": frozenset({"fix", "add", "update", "minor", "simple"}),
+    }
+)
+
+# Whole-word keywords used to estimate complexity, in priority order
+_COMPLEXITY_KEYWORDS = MappingProxyType(
+    {
+        "high": frozenset(
+            {"distributed", "concurrent", "async", "cluster", "scaling", "architecture"}
+        ),
+        "medium": frozenset(
+            {"database", "authentication", "api", "integration", "caching"}
+        ),
+        "low": frozenset({"documentation", "formatting", "style", "typo", "comment"}),
+    }
+)
+
+# Bucket names, highest priority first
+_SCOPE_PRIORITY = tuple(_SCOPE_KEYWORDS)
+_COMPLEXITY_PRIORITY = tuple(_COMPLEXITY_KEYWORDS)
+
+# Reverse indexes (keyword -> bucket); built lowest priority first so a
+# keyword listed in several buckets maps to the highest-priority one
+_SCOPE_BY_KEYWORD = MappingProxyType(
+    {
+        keyword: size
+        for size in reversed(_SCOPE_PRIORITY)
+        for keyword in _SCOPE_KEYWORDS[size]
+    }
+)
+_COMPLEXITY_BY_KEYWORD = MappingProxyType(
+    {
+        keyword: level
+        for level in reversed(_COMPLEXITY_PRIORITY)
+        for keyword in _COMPLEXITY_KEYWORDS[level]
+    }
+)
+
+# Whole-word keywords that trigger each risk category, in report order
+_RISK_KEYWORDS = MappingProxyType(
+    {
+        "database": frozenset({"database", "schema", "migration", "db"}),
+        "security": frozenset(
+            {"authentication", "auth", "security", "oauth", "oauth2"}
+        ),
+        "api": frozenset({"api", "endpoint", "endpoints", "interface"}),
+        "performance": frozenset({"performance", "optimization", "caching", "scaling"}),
+        "refactor": frozenset({"refactor"}),
+        "integration": frozenset({"integration", "external"}),
+        "large_scope": frozenset(
+            {"complete", "entire", "system", "rewrite", "overhaul"}
+        ),
+    }
+)
+
+# Reverse index so a task is classified in one pass over its words
+_RISK_CATEGORY_BY_KEYWORD = MappingProxyType(
+    {
+        keyword: category
+        for category, keywords in _RISK_KEYWORDS.items()
+        for keyword in keywords
+    }
+)
+
+# Verbs that turn an API task into a potentially breaking change
+_API_CHANGE_KEYWORDS = frozenset({"change", "update", "modify", "refactor", "break"})
+
+# Risk category -> messages added to the PLAN, in report order
+_RISK_MESSAGES = MappingProxyType(
+    {
+        "database": (
+            "Database changes may require migration and could affect existing data",
+            "Consider backup and rollback strategy",
+        ),
+        "security": (
+            "Security implications - ensure thorough review and testing",
+            "May affect existing user sessions or authentication flows",
+        ),
+        "api": ("Ensure backward compatibility or provide migration path",),
+        "performance": (
+            "Performance changes need benchmarking and testing",
+            "May have different behavior under load",
+        ),
+        "refactor": (
+            "Ensure comprehensive test coverage before refactoring",
+            "Risk of introducing regressions - test thoroughly",
+        ),
+        "integration": (
+            "External dependencies may have availability or reliability issues",
+            "Need error handling for third-party service failures",
+        ),
+        "large_scope": (
+            "Large scope - consider breaking into smaller tasks",
+            "Extended development time may lead to merge conflicts",
+        ),
+    }
+)
+
+# Characters allowed in a lowercase module name
+_MODULE_CHARS = frozenset(string.ascii_lowercase + string.digits + "_")
+
+
+def _is_module_word(word: str) -> bool:
+    """Check whether a word looks like a lowercase module name.
+
+    Args:
+        word: Lowercased word from the task description
+
+    Returns:
+        True if the word starts with a letter and uses only [a-z0-9_]
+    """
+    return (
+        len(word) > 1
+        and word[0] in string.ascii_lowercase
+        and _MODULE_CHARS.issuperset(word)
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_context_cached(file_path: Path, mtime_ns: int) -> str:
+    """Read a context file, cached per path and modification time.
+
+    Args:
+        file_path: Absolute path to the context file
+        mtime_ns: Modification time of the file; a rewritten file gets a
+            new key and is read again
+
+    Returns:
+        Contents of the file
+    """
+    del mtime_ns  # Only part of the cache key
+    return file_path.read_text(encoding="utf-8")
+
+
+def _cached_context(filename: str) -> str:
+    """Read a context file from .ai-context/, reusing earlier reads.
+
+    The context directory is resolved and the file stat'ed on every call,
+    so a different directory or a newly written or removed file is never
+    served from the cache.
+
+    Args:
+        filename: Name of the context file
+
+    Returns:
+        Contents of the file, or empty string if it does not exist
+    """
+    file_path = utils.get_context_dir() / filename
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ""
+
+    return _read_context_cached(file_path, mtime_ns)
+
+
+@dataclass(frozen=True, slots=True)
+class _TaskView:
+    """Pre-processed forms of a task name shared by every analyzer."""
+
+    name: str
+    words: tuple[str, ...]
+    tokens: frozenset[str]
+    file_matches: tuple[str, ...]
+    module_words: tuple[str, ...]
+
+
+def _is_blank(task_name: str) -> bool:
+    """Check whether a task name is empty or whitespace only.
+
+    Args:
+        task_name: The task name/description
+
+    Returns:
+        True if there is nothing to analyze
+    """
+    return not task_name or task_name.isspace()
+
+
+def _tokenize(task_name: str) -> tuple[str, ...]:
+    """Lowercase a task description and split it into words.
+
+    Punctuation (other than "_") is treated as a separator, so
+    "Fix: login-page" yields ("fix", "login", "page").
+
+    Args:
+        task_name: The task name/description
+
+    Returns:
+        Lowercased words in their original order
+    """
+    return tuple(task_name.lower().translate(_SEPARATOR_TABLE).split())
+
+
+def _file_name(word: str) -> str | None:
+    """Extract an explicit file name such as user_auth.py from one word.
+
+    Args:
+        word: Whitespace-separated word with edge punctuation stripped
+
+    Returns:
+        The file name, or None if the word does not name a file
+    """
+    if not word.endswith(_FILE_EXTENSIONS):
+        return None
+    # Keep only the last path component, e.g. docs/setup.md -> setup.md
+    file_name = word.rpartition("/")[2]
+    stem = file_name[: file_name.rfind(".")]
+    if stem and _FILE_STEM_CHARS.issuperset(stem):
+        return file_name
+    return None
+
+
+def _iter_file_names(task_name: str) -> Iterator[str]:
+    """Yield explicit file names such as user_auth.py in a task name.
+
+    Args:
+        task_name: The task name/description (case preserved)
+
+    Yields:
+        File names in the order they appear
+    """
+    for raw_word in task_name.split():
+        file_name = _file_name(raw_word.strip(_EDGE_PUNCTUATION))
+        if file_name is not None:
+            yield file_name
+
+
+@lru_cache(maxsize=512)
+def _make_view(task_name: str) -> _TaskView:
+    """Lowercase, tokenize and scan a task name once for all analyzers.
+
+    Args:
+        task_name: The task name/description
+
+    Returns:
+        Immutable view of the task used by the analyzer helpers
+    """
+    words = _tokenize(task_name)
+    stripped = [word.strip(_EDGE_PUNCTUATION) for word in task_name.split()]
+    file_names = [_file_name(word) for word in stripped]
+
+    return _TaskView(
+        name=task_name,
+        words=words,
+        tokens=frozenset(words),
+        file_matches=tuple(name for name in file_names if name is not None),
+        # Whole words for module detection; file names are blanked so their
+        # pieces never pass for modules but word positions are kept
+        module_words=tuple(
+            "" if name is not None else word.lower()
+            for word, name in zip(stripped, file_names, strict=True)
+        ),
+    )
+
+
+def _build_objective(view: _TaskView) -> str:
+    """Build the objective statement for a task.
+
+    Args:
+        view: Pre-processed task name
+
+    Returns:
+        Expanded objective statement
+    """
+    words = view.words
+    tokens = view.tokens
+
+    # Look up the action verb from the first word of the task name
+    action = _ACTION_VERBS.get(words[0], "Implement") if words else "Implement"
 
     # Build objective statement
     # Keep the original task name but ensure it's a complete sentence
-    objective = f"{action} {task_name.strip()}"
+    parts = [action, " ", view.name.strip()]
 
     # If task doesn't end with punctuation, add period
-    if not objective.endswith((".", "!", "?")):
-        objective += "."
+    if not parts[-1].endswith(_TERMINAL_PUNCTUATION):
+        parts.append(".")
 
-    # Make first letter uppercase if needed
-    if objective[0].islower():
-        objective = objective[0].upper() + objective[1:]
+    # The first character always comes from the capitalized action verb
+    objective = "".join(parts)
 
     # Add context about what will be delivered
-    if "test" in task_lower and "add" in task_lower:
-        objective += "\n\nThis will include comprehensive test coverage following TDD principles."
-    elif any(word in task_lower for word in ["authentication", "security", "auth"]):
-        objective += "\n\nThis will ensure security best practices are followed."
-    elif "refactor" in task_lower:
-        objective += "\n\nThis will improve code quality while maintaining existing functionality."
-    elif "fix" in task_lower or "bug" in task_lower:
-        objective += (
-            "\n\nThis will resolve the identified issue and prevent regression."
+    if "add" in tokens and not tokens.isdisjoint(_TEST_KEYWORDS):
+        note = "This will include comprehensive test coverage following TDD principles."
+    elif not tokens.isdisjoint(_SECURITY_KEYWORDS):
+        note = "This will ensure security best practices are followed."
+    elif "refactor" in tokens:
+        note = (
+            "This will improve code quality while maintaining existing functionality."
         )
+    elif "fix" in tokens or "bug" in tokens:
+        note = "This will resolve the identified issue and prevent regression."
+    else:
+        return objective
 
-    return objective
-
+    return "".join((objective, "\n\n", note))
 
-def generate_context_summary(task_name: str, task_type: str) -> str:
-    """Generate context summary for PLAN file.
 
-    Creates a context section that includes recent decisions,
-    conventions, and dependencies relevant to the task.
+def _build_context_summary(tokens: frozenset[str], task_type: str) -> str:
+    """Build the context section from the words of a task name.
 
     Args:
-        task_name: The task name/description
+        tokens: Set of lowercased words in the task description
         task_type: Type of task (feature, bugfix, refactor, docs)
 
     Returns:
@@ -91,8 +410,8 @@ def generate_context_summary(task_name: str, task_type: str) -> str:
     context_parts = []
 
     # Read existing context files
-    recent_decisions = read_context_file("RECENT_DECISIONS.md")
-    conventions = read_context_file("CONVENTIONS.md")
+    recent_decisions = _cached_context("RECENT_DECISIONS.md")
+    conventions = _cached_context("CONVENTIONS.md")
 
     # Build context summary
     context_parts.append("**Recent Decisions**:")
@@ -114,15 +433,8 @@ def generate_context_summary(task_name: str, task_type: str) -> str:
     context_parts.append("")
     context_parts.append("**Task Type Context**:")
 
-    task_type_context = {
-        "feature": "New functionality - ensure comprehensive tests and documentation.",
-        "bugfix": "Bug resolution - reproduce issue first, then fix with tests.",
-        "refactor": "Code improvement - maintain behavior, add tests if missing.",
-        "docs": "Documentation update - ensure accuracy and completeness.",
-    }
-
     context_parts.append(
-        f"- {task_type_context.get(task_type, 'General task - follow TDD workflow.')}"
+        f"- {_TASK_TYPE_CONTEXT.get(task_type, 'General task - follow TDD workflow.')}"
     )
 
     # Add dependencies section
@@ -130,18 +442,17 @@ def generate_context_summary(task_name: str, task_type: str) -> str:
     context_parts.append("**Dependencies**:")
 
     # Try to infer dependencies from task name
-    task_lower = task_name.lower()
     dependencies_found = False
 
-    if "database" in task_lower or "migration" in task_lower:
+    if not tokens.isdisjoint(_DATABASE_KEYWORDS):
         context_parts.append("- [ ] Database schema/migration review")
         dependencies_found = True
 
-    if any(word in task_lower for word in ["api", "endpoint", "integration"]):
+    if not tokens.isdisjoint(_API_KEYWORDS):
         context_parts.append("- [ ] API contract review")
         dependencies_found = True
 
-    if "authentication" in task_lower or "auth" in task_lower:
+    if "authentication" in tokens or "auth" in tokens:
         context_parts.append("- [ ] Security review")
         dependencies_found = True
 
@@ -151,75 +462,241 @@ def generate_context_summary(task_name: str, task_type: str) -> str:
     return "\n".join(context_parts)
 
 
-def analyze_task_type_and_scope(task_name: str) -> dict[str, str]:
-    """Analyze task to determine type and scope.
+def _highest_priority_bucket(
+    tokens: frozenset[str],
+    bucket_by_keyword: Mapping[str, str],
+    priority: tuple[str, ...],
+    default: str,
+) -> str:
+    """Pick the highest-priority bucket whose keywords appear in the task.
+
+    Args:
+        tokens: Set of lowercased words in the task description
+        bucket_by_keyword: Reverse index mapping keyword to bucket
+        priority: Bucket names, highest priority first
+        default: Bucket to use when no keyword matches
+
+    Returns:
+        Name of the matched bucket, or the default
+    """
+    matched = {
+        bucket_by_keyword[token] for token in tokens if token in bucket_by_keyword
+    }
+    return next((bucket for bucket in priority if bucket in matched), default)
 
-    Uses keyword analysis to classify the task and estimate its
-    complexity and scope.
+
+def _classify_task(tokens: frozenset[str]) -> dict[str, str]:
+    """Classify task type, scope and complexity from its words.
 
     Args:
-        task_name: The task name/description
+        tokens: Set of lowercased words in the task description
 
     Returns:
         Dictionary with 'type', 'scope', and 'complexity' keys
     """
-    task_lower = task_name.lower()
-
     # Determine task type
     task_type = "feature"  # Default
 
-    if any(word in task_lower for word in ["fix", "bug", "error", "issue"]):
+    if not tokens.isdisjoint(_BUGFIX_KEYWORDS):
         task_type = "bugfix"
-    elif any(word in task_lower for word in ["refactor", "improve", "optimize"]):
+    elif not tokens.isdisjoint(_REFACTOR_KEYWORDS):
         task_type = "refactor"
-    elif any(word in task_lower for word in ["document", "docs", "readme", "guide"]):
+    elif not tokens.isdisjoint(_DOCS_KEYWORDS):
         task_type = "docs"
 
     # Estimate scope based on keywords
-    scope_indicators = {
-        "large": [
-            "complete",
-            "entire",
-            "system",
-            "rewrite",
-            "migration",
-            "overhaul",
-        ],
-        "medium": ["module", "component", "service", "integration", "update"],
-        "small": ["fix", "add", "update", "minor", "simple"],
+    scope = _highest_priority_bucket(
+        tokens, _SCOPE_BY_KEYWORD, _SCOPE_PRIORITY, default="medium"
+    )
+
+    # Estimate complexity based on technical indicators
+    complexity = _highest_priority_bucket(
+        tokens, _COMPLEXITY_BY_KEYWORD, _COMPLEXITY_PRIORITY, default="medium"
+    )
+
+    return {
+        "type": task_type,
+        "scope": scope,
+        "complexity": complexity,
     }
 
-    scope = "medium"  # Default
-    for size, keywords in scope_indicators.items():
-        if any(keyword in task_lower for keyword in keywords):
-            scope = size
-            break
 
-    # Estimate complexity based on technical indicators
-    complexity_indicators = {
-        "high": [
-            "distributed",
-            "concurrent",
-            "async",
-            "cluster",
-            "scaling",
-            "architecture",
-        ],
-        "medium": [
-            "database",
-            "authentication",
-            "api",
-            "integration",
-            "caching",
-        ],
-        "low": ["documentation", "formatting", "style", "typo", "comment"],
+def _find_file_patterns(view: _TaskView) -> list[str]:
+    """Find file and module patterns mentioned in a task.
+
+    Args:
+        view: Pre-processed task name
+
+    Returns:
+        List of file/module patterns found
+    """
+    words = view.module_words
+
+    # Pattern 1: Explicit file names (*.py, *.md, etc.)
+    patterns = list(view.file_matches)
+
+    # Pattern 2: Module names with underscores
+    for i, word in enumerate(words):
+        if word in _MODULE_INDICATORS and i > 0:
+            # Previous word might be the module name
+            prev_word = words[i - 1]
+            if _is_module_word(prev_word):
+                patterns.append(prev_word)
+
+    # Pattern 3: Test file patterns
+    if not view.tokens.isdisjoint(_TEST_KEYWORDS):
+        patterns.append("tests/")
+
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(patterns))
+
+
+def _find_risks(tokens: frozenset[str]) -> list[str]:
+    """Find risks triggered by the words of a task description.
+
+    Args:
+        tokens: Set of lowercased words in the task description
+
+    Returns:
+        List of identified risks and considerations
+    """
+    categories = {
+        _RISK_CATEGORY_BY_KEYWORD[token]
+        for token in tokens
+        if token in _RISK_CATEGORY_BY_KEYWORD
     }
 
-    complexity = "medium"  # Default
-    for level, keywords in complexity_indicators.items():
-        if any(keyword in task_lower for keyword in keywords):
-            complexity = level
-            break
+    risks: list[str] = []
+    for category, messages in _RISK_MESSAGES.items():
+        if category not in categories:
+            continue
+        if category == "api" and not tokens.isdisjoint(_API_CHANGE_KEYWORDS):
+            risks.append("API changes may break existing clients - versioning needed")
+        risks.extend(messages)
+
+    return risks
+
+
+@lru_cache(maxsize=512)
+def _analyze_cached(
+    task_name: str,
+) -> tuple[str, tuple[str, str, str], tuple[str, ...], tuple[str, ...]]:
+    """Run the analyzers that depend only on the task name, memoized.
+
+    Results are stored as tuples so cached values cannot be mutated by
+    callers; the public functions convert them back to lists and dicts.
+
+    Args:
+        task_name: The task name/description
+
+    Returns:
+        Tuple of (objective, (type, scope, complexity), file patterns, risks)
+    """
+    view = _make_view(task_name)
+    analysis = _classify_task(view.tokens)
+
+    return (
+        _build_objective(view),
+        (analysis["type"], analysis["scope"], analysis["complexity"]),
+        tuple(_find_file_patterns(view)),
+        tuple(_find_risks(view.tokens)),
+    )
+
+
+def _analyze_all(task_name: str, task_type: str) -> dict[str, Any]:
+    """Run every analyzer on a task.
+
+    The context summary is built on every call because it depends on the
+    current .ai-context/ files; everything else comes from the memoized
+    pipeline.
+
+    Args:
+        task_name: The task name/description
+        task_type: Type of task (feature, bugfix, refactor, docs)
+
+    Returns:
+        Dictionary with 'objective', 'context', 'analysis',
+        'file_patterns', and 'risks' keys
+    """
+    objective, (kind, scope, complexity), file_patterns, risks = _analyze_cached(
+        task_name
+    )
+
+    return {
+        "objective": objective,
+        "context": _build_context_summary(_make_view(task_name).tokens, task_type),
+        "analysis": {"type": kind, "scope": scope, "complexity": complexity},
+        "file_patterns": list(file_patterns),
+        "risks": list(risks),
+    }
+
+
+def analyze_many(tasks: Sequence[tuple[str, str]]) -> list[dict[str, Any]]:
+    """Analyze a batch of tasks in one call.
+
+    Repeated task names are analyzed once through the shared cache, and
+    the context files are read once for the whole batch.
+
+    Args:
+        tasks: Sequence of (task_name, task_type) pairs
+
+    Returns:
+        One result per task, in input order, each with 'objective',
+        'context', 'analysis', 'file_patterns', and 'risks' keys
+    """
+    return [_analyze_all(task_name, task_type) for task_name, task_type in tasks]
+
+
+def extract_objective_from_task_description(task_name: str) -> str:
+    """Extract and expand objective from task description.
+
+    Analyzes the task name and creates a clear, detailed objective
+    statement that describes what needs to be accomplished.
+
+    Args:
+        task_name: The task name/description provided by user
+
+    Returns:
+        Expanded objective statement
+    """
+    return _analyze_cached(task_name)[0]
+
+
+def generate_context_summary(task_name: str, task_type: str) -> str:
+    """Generate context summary for PLAN file.
+
+    Creates a context section that includes recent decisions,
+    conventions, and dependencies relevant to the task.
+
+    Args:
+        task_name: The task name/description
+        task_type: Type of task (feature, bugfix, refactor, docs)
+
+    Returns:
+        Formatted context section content
+    """
+    if _is_blank(task_name):
+        return _build_context_summary(frozenset(), task_type)
+
+    return _build_context_summary(_make_view(task_name).tokens, task_type)
+
+
+def analyze_task_type_and_scope(task_name: str) -> dict[str, str]:
+    """Analyze task to determine type and scope.
+
+    Uses whole-word keyword analysis to classify the task and estimate
+    its complexity and scope.
+
+    Args:
+        task_name: The task name/description
+
+    Returns:
+        Dictionary with 'type', 'scope', and 'complexity' keys
+    """
+    if _is_blank(task_name):
+        return {"type": "feature", "scope": "medium", "complexity": "medium"}
+
+    task_type, scope, complexity = _analyze_cached(task_name)[1]
 
     return {
         "type": task_type,
@@ -240,52 +717,24 @@ def extract_file_patterns(task_name: str) -> list[str]:
     Returns:
         List of file/module patterns found
     """
-    patterns = []
+    if _is_blank(task_name):
+        return []
 
-    # Pattern 1: Explicit file names (*.py, *.md, etc.)
-    file_pattern = r"\b([a-zA-Z0-9_]+\.(py|md|txt|yml|yaml|toml|json))\b"
-    file_matches = re.findall(file_pattern, task_name)
-    patterns.extend([match[0] for match in file_matches])
+    return list(_analyze_cached(task_name)[2])
 
-    # Pattern 2: Module names with underscores
-    module_pattern = r"\b([a-z][a-z0-9_]+)\b"
-    words = task_name.lower().split()
 
-    # Common module/package indicators
-    module_indicators = [
-        "module",
-        "package",
-        "component",
-        "service",
-        "handler",
-        "manager",
-        "controller",
-        "model",
-        "view",
-        "utils",
-        "helpers",
-    ]
+def has_file_pattern(task_name: str) -> bool:
+    """Check whether a task description mentions an explicit file name.
 
-    for i, word in enumerate(words):
-        if word in module_indicators and i > 0:
-            # Previous word might be the module name
-            prev_word = words[i - 1]
-            if re.match(module_pattern, prev_word):
-                patterns.append(prev_word)
+    Stops scanning at the first file name found.
 
-    # Pattern 3: Test file patterns
-    if "test" in task_name.lower():
-        patterns.append("tests/")
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_patterns = []
-    for pattern in patterns:
-        if pattern not in seen:
-            seen.add(pattern)
-            unique_patterns.append(pattern)
+    Args:
+        task_name: The task name/description
 
-    return unique_patterns
+    Returns:
+        True if a file such as user_auth.py is mentioned
+    """
+    return next(_iter_file_names(task_name), None) is not None
 
 
 def identify_risks_from_description(task_name: str) -> list[str]:
@@ -300,58 +749,7 @@ def identify_risks_from_description(task_name: str) -> list[str]:
     Returns:
         List of identified risks and considerations
     """
-    risks = []
-    task_lower = task_name.lower()
-
-    # Database-related risks
-    if any(word in task_lower for word in ["database", "schema", "migration", "db"]):
-        risks.append(
-            "Database changes may require migration and could affect existing data"
-        )
-        risks.append("Consider backup and rollback strategy")
-
-    # Authentication/Security risks
-    if any(
-        word in task_lower for word in ["authentication", "auth", "security", "oauth"]
-    ):
-        risks.append("Security implications - ensure thorough review and testing")
-        risks.append("May affect existing user sessions or authentication flows")
-
-    # API-related risks
-    if any(word in task_lower for word in ["api", "endpoint", "interface"]):
-        if any(
-            word in task_lower
-            for word in ["change", "update", "modify", "refactor", "break"]
-        ):
-            risks.append("API changes may break existing clients - versioning needed")
-        risks.append("Ensure backward compatibility or provide migration path")
-
-    # Performance-related risks
-    if any(
-        word in task_lower
-        for word in ["performance", "optimization", "caching", "scaling"]
-    ):
-        risks.append("Performance changes need benchmarking and testing")
-        risks.append("May have different behavior under load")
-
-    # Refactoring risks
-    if "refactor" in task_lower:
-        risks.append("Ensure comprehensive test coverage before refactoring")
-        risks.append("Risk of introducing regressions - test thoroughly")
-
-    # Integration risks
-    if "integration" in task_lower or "external" in task_lower:
-        risks.append(
-            "External dependencies may have availability or reliability issues"
-        )
-        risks.append("Need error handling for third-party service failures")
+    if _is_blank(task_name):
+        return []
 
-    # Large scope risks
-    if any(
-        word in task_lower
-        for word in ["complete", "entire", "system", "rewrite", "overhaul"]
-    ):
-        risks.append("Large scope - consider breaking into smaller tasks")
-        risks.append("Extended development time may lead to merge conflicts")
-
-    return risks
+    return list(_analyze_cached(task_name)[3])
@@ -6,10 +6,27 @@ based on task type (feature, bugfix, docs, refactor).
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from scripts.ai_tools.utils import format_timestamp
 
+# Placeholders substitute_variables fills in, matched in one pass
+_VARIABLE_RE = re.compile(r"\{\{(session_id|task_name|task_type|timestamp)\}\}")
+
+# Task types with a bundled template, in the order error messages list them
+_TASK_TYPES = ("feature", "bugfix", "docs", "refactor")
+
+# Set form of _TASK_TYPES for membership checks
+_VALID_TYPES = frozenset(_TASK_TYPES)
+
+# Valid types as shown in the unknown-type error
+_VALID_TYPES_STR = ", ".join(_TASK_TYPES)
+
+# Templates directory (next to this module)
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
 
 class TemplateNotFoundError(Exception):
     """Raised when requested template file is not found."""
@@ -27,19 +44,13 @@ def get_template_path(task_type: str) -> Path:
     Raises:
         TemplateNotFoundError: If task type is unknown
     """
-    valid_types = ["feature", "bugfix", "docs", "refactor"]
-
-    if task_type not in valid_types:
+    if task_type not in _VALID_TYPES:
         error_message = (
-            f"Unknown task type: {task_type}. Valid types: {', '.join(valid_types)}"
+            f"Unknown task type: {task_type}. Valid types: {_VALID_TYPES_STR}"
         )
         raise TemplateNotFoundError(error_message)
 
-    # Get templates directory (same directory as this module)
-    templates_dir = Path(__file__).parent / "templates"
-    template_file = templates_dir / f"{task_type}.md"
-
-    return template_file
+    return _TEMPLATES_DIR / f"{task_type}.md"
 
 
 def substitute_variables(
@@ -59,16 +70,32 @@ def substitute_variables(
     Returns:
         Template with all variables substituted
     """
-    # Get current timestamp
-    timestamp = format_timestamp()
+    values = {
+        "session_id": session_id,
+        "task_name": task_name,
+        "task_type": task_type,
+        "timestamp": format_timestamp(),
+    }
 
-    # Perform substitutions
-    result = template.replace("{{session_id}}", session_id)
-    result = result.replace("{{task_name}}", task_name)
-    result = result.replace("{{task_type}}", task_type)
-    result = result.replace("{{timestamp}}", timestamp)
+    # Substitute every placeholder in a single scan, so a value that itself
+    # contains a placeholder (e.g. a task name) is inserted verbatim
+    return _VARIABLE_RE.sub(lambda match: values[match.group(1)], template)
 
-    return result
+
+@lru_cache(maxsize=len(_TASK_TYPES))
+def _read_template(template_path: Path, mtime_ns: int) -> str:
+    """Read a template file, cached per path and modification time.
+
+    Args:
+        template_path: Path to the template file
+        mtime_ns: Modification time of the file; an edited template gets
+            a new key and is read again
+
+    Returns:
+        Raw template content
+    """
+    del mtime_ns  # Only part of the cache key
+    return template_path.read_text(encoding="utf-8")
 
 
 def load_template(
@@ -92,16 +119,18 @@ def load_template(
     # Get template path
     template_path = get_template_path(task_type)
 
-    # Check if file exists
-    if not template_path.exists():
+    # Check if file exists; the stat also supplies the cache key
+    try:
+        mtime_ns = template_path.stat().st_mtime_ns
+    except FileNotFoundError:
         error_message = (
             f"Template file not found: {template_path}. "
             f"Task type '{task_type}' is valid but template file is missing."
         )
-        raise TemplateNotFoundError(error_message)
+        raise TemplateNotFoundError(error_message) from None
 
     # Load template content
-    template_content = template_path.read_text()
+    template_content = _read_template(template_path, mtime_ns)
 
     # Substitute variables
     result = substitute_variables(
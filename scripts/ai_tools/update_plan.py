@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 from scripts.ai_tools.log_execution import log_execution
 from scripts.ai_tools.utils import (
@@ -14,6 +20,105 @@ from scripts.ai_tools.utils import (
     print_success,
 )
 
+# Leading part of a checkbox line (indentation, dash and box)
+_CHECKBOX_HEAD_RE = re.compile(r"^\s*-\s*\[([ x])\]")
+
+# Checkbox at the start of any line of a whole plan
+_CHECKBOX_LINE_RE = re.compile(r"^[^\S\n]*-[^\S\n]*\[([ x])\]", re.MULTILINE)
+
+# Checkbox marker within a line
+_CHECKBOX_MARK_RE = re.compile(r"\[([ x])\]")
+
+
+def _char_class_mask(text: str) -> int:
+    """Summarize which characters occur in text as a 64-bit mask.
+
+    Characters are folded into 64 classes by code point, so two masks can
+    be compared with a single AND and popcount.
+
+    Args:
+        text: String to summarize
+
+    Returns:
+        Bit mask with one bit set per character class present in text
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _build_pattern_masks(pattern: str) -> dict[str, int]:
+    """Map each character of pattern to a bit mask of its positions.
+
+    Args:
+        pattern: String the distance is measured against
+
+    Returns:
+        Dictionary of character to position bit mask
+    """
+    pattern_masks: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        pattern_masks[char] = pattern_masks.get(char, 0) | (1 << i)
+    return pattern_masks
+
+
+def _myers_distance(
+    pattern_masks: dict[str, int],
+    pattern_len: int,
+    text: str,
+    max_distance: int | None = None,
+) -> int:
+    """Calculate Levenshtein distance with Myers' bit-parallel algorithm.
+
+    Each column of the DP matrix is kept as two bit vectors of +1/-1
+    vertical deltas over the pattern, so a whole column is updated with a
+    handful of integer operations instead of one Python-level step per cell.
+    The pattern masks are taken pre-built so callers comparing one string
+    against many can build them once.
+
+    Args:
+        pattern_masks: Position masks from _build_pattern_masks(pattern)
+        pattern_len: Length of the pattern (must be non-zero)
+        text: String to compare against the pattern
+        max_distance: Stop early once the distance must exceed this
+
+    Returns:
+        Minimum edit distance between pattern and text, or a lower bound
+        above max_distance if the computation stopped early
+    """
+    all_bits = (1 << pattern_len) - 1
+    last_bit = 1 << (pattern_len - 1)
+    positive = all_bits
+    negative = 0
+    distance = pattern_len
+    # Each remaining text character can lower the distance by at most one
+    remaining = len(text)
+
+    for char in text:
+        eq = pattern_masks.get(char, 0)
+        vertical = eq | negative
+        horizontal = (((eq & positive) + positive) ^ positive) | eq
+        horizontal_pos = negative | ~(horizontal | positive)
+        horizontal_neg = positive & horizontal
+
+        # The last row of the column holds the distance for this prefix
+        if horizontal_pos & last_bit:
+            distance += 1
+        elif horizontal_neg & last_bit:
+            distance -= 1
+
+        horizontal_pos = (horizontal_pos << 1) | 1
+        horizontal_neg <<= 1
+        positive = (horizontal_neg | ~(vertical | horizontal_pos)) & all_bits
+        negative = horizontal_pos & vertical
+
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            return distance - remaining
+
+    return distance
+
 
 def calculate_levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate Levenshtein distance between two strings.
@@ -29,82 +134,194 @@ def calculate_levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         Minimum edit distance between the strings
     """
+    # Keep the shorter string in s2 (it becomes the bit-vector pattern)
     if len(s1) < len(s2):
-        return calculate_levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+
+    # A shared prefix or suffix never contributes to the distance, and
+    # near-miss typos usually share most of both, so trim them first
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1 = s1[start:end1]
+    s2 = s2[start:end2]
 
     if len(s2) == 0:
         return len(s1)
 
-    # Create distance matrix
-    previous_row: list[int] = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of substitution (0 if characters match, 1 if they don't)
-            cost = 0 if c1 == c2 else 1
-            # Minimum of: insert, delete, substitute
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + cost
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
+    return _myers_distance(_build_pattern_masks(s2), len(s2), s1)
 
 
-def find_similar_items(
+@lru_cache(maxsize=256)
+def _find_similar_cached(
     target: str,
-    items: list[str],
-    threshold: float = 0.6,
-) -> list[tuple[str, float]]:
-    """Find items similar to target using fuzzy matching.
+    items: tuple[str, ...],
+    threshold: float,
+    limit: int | None,
+) -> tuple[tuple[str, float], ...]:
+    """Score and rank items against target (memoized find_similar_items).
 
-    Uses both substring matching and Levenshtein distance to calculate
-    similarity. Returns items above the similarity threshold, sorted by
-    similarity (descending).
+    Keyed on the item texts themselves, so an edited plan produces a new
+    key and a stale ranking is never returned.
 
     Args:
         target: Target string to match against
-        items: List of items to search
+        items: Items to search
         threshold: Minimum similarity score (0.0 to 1.0) to include
+        limit: Maximum number of results to keep (None keeps all)
 
     Returns:
-        List of (item, similarity_score) tuples, sorted by similarity
+        Tuple of (item, similarity_score) pairs, sorted by similarity
     """
-    if not items:
-        return []
-
     target_lower = target.lower()
+    target_len = len(target_lower)
+    # The target is the Myers pattern for every candidate, so its position
+    # masks are built once rather than per comparison
+    target_masks = _build_pattern_masks(target_lower)
+    target_classes = _char_class_mask(target_lower)
     results = []
 
     for item in items:
         item_lower = item.lower()
+        item_len = len(item_lower)
 
         # Check for substring match first (higher priority)
         if target_lower in item_lower:
             # Substring match - calculate score based on length ratio
             # Exact match = 1.0, substring = proportional to coverage
-            if target_lower == item_lower:
+            if target_len == item_len:
                 similarity = 1.0
             else:
                 # Higher score if target covers more of the item
-                similarity = 0.7 + (0.3 * len(target_lower) / len(item_lower))
+                similarity = 0.7 + (0.3 * target_len / item_len)
         else:
-            # Use Levenshtein distance for fuzzy matching
-            distance = calculate_levenshtein_distance(target_lower, item_lower)
-
-            # Convert distance to similarity score (0.0 to 1.0)
-            max_len = max(len(target_lower), len(item_lower))
-            similarity = 1.0 if max_len == 0 else 1.0 - (distance / max_len)
+            # Convert distance to similarity score (0.0 to 1.0); an empty
+            # target is a substring of everything, so max_len is never 0
+            max_len = max(target_len, item_len)
+
+            # The length difference is a lower bound on the distance, so
+            # skip the distance computation when even that misses threshold
+            if 1.0 - (abs(target_len - item_len) / max_len) < threshold:
+                continue
+
+            # Every character class present in one string but absent from
+            # the other needs at least one edit, and one substitution fixes
+            # at most one class on each side, so this is another lower bound
+            item_classes = _char_class_mask(item_lower)
+            missing = max(
+                (target_classes & ~item_classes).bit_count(),
+                (item_classes & ~target_classes).bit_count(),
+            )
+            if 1.0 - (missing / max_len) < threshold:
+                continue
+
+            # Largest distance that still meets threshold, nudged so the
+            # cutoff agrees exactly with the float similarity below
+            max_distance = int(max_len * (1.0 - threshold))
+            while 1.0 - ((max_distance + 1) / max_len) >= threshold:
+                max_distance += 1
+
+            # Use Levenshtein distance for fuzzy matching; hopeless
+            # candidates stop early with a lower bound that fails threshold
+            distance = _myers_distance(
+                target_masks, target_len, item_lower, max_distance
+            )
+            similarity = 1.0 - (distance / max_len)
 
         # Include if above threshold
         if similarity >= threshold:
             results.append((item, similarity))
 
+    # Only the best few are needed for suggestions; a bounded heap avoids
+    # sorting every match. Both orderings are stable, so ties keep plan order
+    if limit is not None and limit < len(results):
+        return tuple(heapq.nlargest(limit, results, key=itemgetter(1)))
+
     # Sort by similarity (descending)
-    results.sort(key=lambda x: x[1], reverse=True)
+    results.sort(key=itemgetter(1), reverse=True)
+
+    return tuple(results)
+
+
+def find_similar_items(
+    target: str,
+    items: list[str],
+    threshold: float = 0.6,
+    limit: int | None = None,
+) -> list[tuple[str, float]]:
+    """Find items similar to target using fuzzy matching.
+
+    Uses both substring matching and Levenshtein distance to calculate
+    similarity. Returns items above the similarity threshold, sorted by
+    similarity (descending).
+
+    Args:
+        target: Target string to match against
+        items: List of items to search
+        threshold: Minimum similarity score (0.0 to 1.0) to include
+        limit: Maximum number of results to return (default: all)
+
+    Returns:
+        List of (item, similarity_score) tuples, sorted by similarity
+    """
+    if not items:
+        return []
+
+    return list(_find_similar_cached(target, tuple(items), threshold, limit))
+
+
+def _match_checkbox(line: str) -> tuple[bool, int] | None:
+    """Match the checkbox at the start of a line.
+
+    Plan checkboxes are almost always written "- [ ]" or "- [x]", which is
+    checked with plain string tests; other spacing around the dash falls
+    back to the regex.
+
+    Args:
+        line: Line to inspect
+
+    Returns:
+        Tuple of (is_checked, end offset of the box) or None if the line
+        is not a checkbox
+    """
+    stripped = line.lstrip()
+    if stripped.startswith("- [") and stripped[4:5] == "]" and stripped[3] in " x":
+        return (stripped[3] == "x", len(line) - len(stripped) + 5)
+
+    if not stripped.startswith("-"):
+        return None
+
+    match = _CHECKBOX_HEAD_RE.match(line)
+    if match is None:
+        return None
+    return (match.group(1) == "x", match.end())
 
-    return results
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the lines of content without building an intermediate list.
+
+    Unlike splitting on newlines, no empty line is yielded after a trailing
+    newline or for empty content; scans looking for checkboxes or headers
+    never match an empty line, so the results are the same.
+
+    Args:
+        content: Text to iterate over
+
+    Yields:
+        Each line, without its newline
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find("\n", start)
+        if end < 0:
+            end = length
+        yield content[start:end]
+        start = end + 1
 
 
 def validate_item_not_empty(item_text: str) -> str | None:
@@ -138,19 +355,24 @@ def validate_phase_exists(plan_content: str, phase_name: str | None) -> str | No
         # None means "add to last phase", which is always valid
         return None
 
-    lines = plan_content.split("\n")
-    phase_name_lower = phase_name.lower()
+    return _indexed_phase_error(_parse_plan(plan_content), phase_name)
+
 
-    # Find all phase headers
-    available_phases = []
-    for line in lines:
-        if line.startswith("### Phase"):
-            available_phases.append(line.strip())
-            # Check if this line matches the target phase
-            if phase_name_lower in line.lower():
-                return None  # Phase found
+def _indexed_phase_error(index: _PlanIndex, phase_name: str) -> str | None:
+    """Validate that a phase exists in a parsed plan.
+
+    Args:
+        index: Parsed plan
+        phase_name: Phase name to validate
+
+    Returns:
+        Error message if phase not found, None if valid
+    """
+    if _find_indexed_phase(index, phase_name) is not None:
+        return None  # Phase found
 
     # Phase not found - build helpful error message
+    available_phases = [index.lines[i].strip() for i in index.phase_starts]
     if not available_phases:
         return (
             f"Phase '{phase_name}' does not exist. "
@@ -165,6 +387,28 @@ def validate_phase_exists(plan_content: str, phase_name: str | None) -> str | No
     )
 
 
+@lru_cache(maxsize=8)
+def _normalized_checkbox_items(plan_content: str) -> frozenset[str]:
+    """Collect the normalized text of every checkbox item in a plan.
+
+    Items are lowercased with whitespace collapsed. The set is cached per
+    plan content, so repeated duplicate checks against the same plan only
+    normalize its items once.
+
+    Args:
+        plan_content: Plan content
+
+    Returns:
+        Set of normalized item texts
+    """
+    normalized = set()
+    for line in _iter_lines(plan_content):
+        checkbox = _match_checkbox(line)
+        if checkbox:
+            normalized.add(" ".join(line[checkbox[1] :].lower().split()))
+    return frozenset(normalized)
+
+
 def validate_no_duplicates(plan_content: str, new_item: str) -> str | None:
     """Validate that item doesn't already exist in plan.
 
@@ -178,24 +422,14 @@ def validate_no_duplicates(plan_content: str, new_item: str) -> str | None:
     Returns:
         Error message if duplicate found, None if valid
     """
-    lines = plan_content.split("\n")
-
     # Normalize the new item for comparison
     new_item_normalized = " ".join(new_item.lower().split())
 
-    for line in lines:
-        # Check if line contains a checkbox
-        match = re.match(r"^\s*-\s*\[([ x])\]\s*(.*)$", line)
-        if match:
-            existing_item = match.group(2)
-            # Normalize existing item for comparison
-            existing_normalized = " ".join(existing_item.lower().split())
-
-            if new_item_normalized == existing_normalized:
-                return (
-                    f"Item '{new_item}' already exists in plan. "
-                    f"Use --rename to modify it or --remove to delete it."
-                )
+    if new_item_normalized in _normalized_checkbox_items(plan_content):
+        return (
+            f"Item '{new_item}' already exists in plan. "
+            f"Use --rename to modify it or --remove to delete it."
+        )
 
     return None
 
@@ -209,13 +443,12 @@ def extract_all_checkbox_items(content: str) -> list[str]:
     Returns:
         List of checkbox item texts (without checkbox markers)
     """
-    lines = content.split("\n")
     items = []
 
-    for line in lines:
-        match = re.match(r"^\s*-\s*\[([ x])\]\s*(.*)$", line)
-        if match:
-            items.append(match.group(2))
+    for line in _iter_lines(content):
+        checkbox = _match_checkbox(line)
+        if checkbox:
+            items.append(line[checkbox[1] :].lstrip())
 
     return items
 
@@ -230,18 +463,14 @@ def find_checkbox_line(content: str, item_text: str) -> tuple[int, str] | None:
     Returns:
         Tuple of (line_number, line_content) or None if not found
     """
-    lines = content.split("\n")
-    item_lower = item_text.lower()
-
-    for i, line in enumerate(lines):
-        # Check if line contains a checkbox
-        if re.match(r"^\s*-\s*\[([ x])\]", line):
-            # Check if item text is in line (case-insensitive, fuzzy)
-            line_lower = line.lower()
-            if item_lower in line_lower:
-                return (i, line)
+    # Same lookup update_plan uses, so the two can never disagree
+    index = _parse_plan(content)
+    checkbox = _find_indexed_checkbox(index, item_text)
+    if checkbox is None:
+        return None
 
-    return None
+    line_num = checkbox[0]
+    return (line_num, index.lines[line_num])
 
 
 def toggle_checkbox(line: str, check: bool) -> str:
@@ -255,7 +484,14 @@ def toggle_checkbox(line: str, check: bool) -> str:
         Updated line
     """
     checkbox = "[x]" if check else "[ ]"
-    return re.sub(r"\[([ x])\]", checkbox, line, count=1)
+
+    match = _match_checkbox(line)
+    if match is None:
+        return _CHECKBOX_MARK_RE.sub(checkbox, line, count=1)
+
+    # Splice the new box over the old one at its known offset
+    box_end = match[1]
+    return line[: box_end - 3] + checkbox + line[box_end:]
 
 
 def count_checkboxes(content: str) -> tuple[int, int]:
@@ -267,18 +503,10 @@ def count_checkboxes(content: str) -> tuple[int, int]:
     Returns:
         Tuple of (checked_count, total_count)
     """
-    lines = content.split("\n")
-    total = 0
-    checked = 0
-
-    for line in lines:
-        match = re.match(r"^\s*-\s*\[([ x])\]", line)
-        if match:
-            total += 1
-            if match.group(1) == "x":
-                checked += 1
-
-    return (checked, total)
+    # One multiline scan; [^\S\n] is \s without the newline, so this
+    # matches exactly the lines _match_checkbox accepts
+    boxes = _CHECKBOX_LINE_RE.findall(content)
+    return (boxes.count("x"), len(boxes))
 
 
 def extract_phase_section(content: str, line_num: int) -> str:
@@ -291,23 +519,10 @@ def extract_phase_section(content: str, line_num: int) -> str:
     Returns:
         Section content
     """
-    lines = content.split("\n")
-
-    # Find the phase header before this line
-    phase_start = 0
-    for i in range(line_num, -1, -1):
-        if lines[i].startswith("### Phase"):
-            phase_start = i
-            break
-
-    # Find the next phase header or end
-    phase_end = len(lines)
-    for i in range(line_num + 1, len(lines)):
-        if lines[i].startswith("###"):
-            phase_end = i
-            break
-
-    return "\n".join(lines[phase_start:phase_end])
+    # Same bounds update_plan uses, so the two can never disagree
+    index = _parse_plan(content)
+    phase_start, phase_end = _indexed_phase_bounds(index, line_num)
+    return "\n".join(index.lines[phase_start:phase_end])
 
 
 def find_phase_section(content: str, phase_name: str) -> str:
@@ -320,67 +535,162 @@ def find_phase_section(content: str, phase_name: str) -> str:
     Returns:
         Phase section content, or empty string if not found
     """
-    lines = content.split("\n")
-    phase_name_lower = phase_name.lower()
+    index = _parse_plan(content)
 
     # Find phase header
-    phase_start = -1
+    header = _find_indexed_phase(index, phase_name)
+    if header is None:
+        return ""
+
+    # The phase runs from its header to the next ### (or end of file)
+    phase_start, phase_end = _indexed_phase_bounds(index, header)
+    return "\n".join(index.lines[phase_start:phase_end])
+
+
+@dataclass(frozen=True, slots=True)
+class _PlanIndex:
+    """Lines, checkboxes and section headers of a plan, from one pass."""
+
+    lines: list[str]
+    # Lowercased lines, aligned with lines
+    lower_lines: list[str]
+    # (line_number, is_checked, item_text) for every checkbox line
+    checkboxes: list[tuple[int, bool, str]]
+    # Line numbers of "### Phase" headers
+    phase_starts: list[int]
+    # Line numbers of every "###" header (phase or not)
+    section_starts: list[int]
+    checked: int
+
+
+def _parse_plan(content: str) -> _PlanIndex:
+    """Index plan content in a single pass over its lines.
+
+    Args:
+        content: Plan file content
+
+    Returns:
+        Index of the plan's lines, checkboxes and section headers
+    """
+    lines = content.split("\n")
+    checkboxes = []
+    phase_starts = []
+    section_starts = []
+    checked = 0
+
     for i, line in enumerate(lines):
-        if line.startswith("### Phase") and phase_name_lower in line.lower():
-            phase_start = i
-            break
+        checkbox = _match_checkbox(line)
+        if checkbox:
+            is_checked, text_start = checkbox
+            checked += is_checked
+            checkboxes.append((i, is_checked, line[text_start:].lstrip()))
+        elif line.startswith("###"):
+            section_starts.append(i)
+            if line.startswith("### Phase"):
+                phase_starts.append(i)
+
+    return _PlanIndex(
+        lines,
+        content.lower().split("\n"),
+        checkboxes,
+        phase_starts,
+        section_starts,
+        checked,
+    )
 
-    if phase_start == -1:
-        return ""
 
-    # Find end of phase (next ### or end of file)
-    phase_end = len(lines)
-    for i in range(phase_start + 1, len(lines)):
-        if lines[i].startswith("###"):
-            phase_end = i
-            break
+def _find_indexed_checkbox(
+    index: _PlanIndex, item_text: str
+) -> tuple[int, bool, str] | None:
+    """Find the first checkbox line containing item_text (case-insensitive).
 
-    return "\n".join(lines[phase_start:phase_end])
+    Args:
+        index: Parsed plan
+        item_text: Text to search for
 
+    Returns:
+        The matching (line_number, is_checked, item_text) entry, or None
+    """
+    item_lower = item_text.lower()
+    for checkbox in index.checkboxes:
+        if item_lower in index.lower_lines[checkbox[0]]:
+            return checkbox
+    return None
 
-def add_item_to_plan(
-    plan_content: str,
+
+def _find_indexed_phase(index: _PlanIndex, phase_name: str) -> int | None:
+    """Find the first "### Phase" header containing phase_name (case-insensitive).
+
+    Args:
+        index: Parsed plan
+        phase_name: Name or partial name of the phase
+
+    Returns:
+        Line number of the header, or None if no phase matches
+    """
+    phase_lower = phase_name.lower()
+    for line_num in index.phase_starts:
+        if phase_lower in index.lower_lines[line_num]:
+            return line_num
+    return None
+
+
+def _indexed_phase_bounds(index: _PlanIndex, line_num: int) -> tuple[int, int]:
+    """Find the bounds of the phase section containing the given line.
+
+    The section starts at the closest "### Phase" header at or before the
+    line (or the top of the file) and ends before the next "###" header
+    after it (or the end of the file).
+
+    Args:
+        index: Parsed plan
+        line_num: Line number to find section for
+
+    Returns:
+        Tuple of (start, end) line numbers, end exclusive
+    """
+    phase_pos = bisect_right(index.phase_starts, line_num)
+    phase_start = index.phase_starts[phase_pos - 1] if phase_pos else 0
+
+    section_pos = bisect_left(index.section_starts, line_num + 1)
+    if section_pos < len(index.section_starts):
+        phase_end = index.section_starts[section_pos]
+    else:
+        phase_end = len(index.lines)
+
+    return (phase_start, phase_end)
+
+
+def _add_item_lines(
+    lines: list[str],
+    index: _PlanIndex,
     item_text: str,
     phase: str | None = None,
-) -> str:
-    """Add a new checklist item to plan.
+) -> None:
+    """Add a new checklist item to plan lines in place.
 
     Args:
-        plan_content: Current plan content
+        lines: Plan content split into lines (modified in place)
+        index: Parsed plan, matching lines before the edit
         item_text: Text of new item (without checkbox)
         phase: Phase name to add to (default: last phase)
-
-    Returns:
-        Updated plan content
     """
-    lines = plan_content.split("\n")
     new_item = f"- [ ] {item_text}"
 
     # Find target phase
     if phase:
-        phase_lower = phase.lower()
-        target_phase_idx = -1
-
-        for i, line in enumerate(lines):
-            if line.startswith("### Phase") and phase_lower in line.lower():
-                target_phase_idx = i
-                break
+        target_phase_idx = _find_indexed_phase(index, phase)
 
-        if target_phase_idx == -1:
+        if target_phase_idx is None:
             # Phase not found, add to end before ## sections
             insert_idx = len(lines)
             for i, line in enumerate(lines):
                 if line.startswith("##") and not line.startswith("###"):
                     insert_idx = i
                     break
-            lines.insert(insert_idx, new_item)
-            lines.insert(insert_idx, "")  # Blank line before item
-            return "\n".join(lines)
+            # Blank line before item, both inserted with a single shift
+            lines[insert_idx:insert_idx] = ["", new_item]
+            return
 
         # Find last checkbox in this phase
         insert_idx = target_phase_idx + 1
@@ -391,17 +701,17 @@ def add_item_to_plan(
             if lines[i].startswith("##") and not lines[i].startswith("###"):
                 # Non-phase section found
                 break
-            if re.match(r"^\s*-\s*\[([ x])\]", lines[i]):
+            if _match_checkbox(lines[i]):
                 insert_idx = i + 1
 
         lines.insert(insert_idx, new_item)
     else:
         # No phase specified, add to last phase
-        # Find last checkbox in entire plan
-        last_checkbox_idx = -1
-        for i, line in enumerate(lines):
-            if re.match(r"^\s*-\s*\[([ x])\]", line):
-                last_checkbox_idx = i
+        # Find last checkbox in entire plan, scanning back from the end
+        last_checkbox_idx = next(
+            (i for i in range(len(lines) - 1, -1, -1) if _match_checkbox(lines[i])),
+            -1,
+        )
 
         if last_checkbox_idx == -1:
             # No checkboxes found, add to end
@@ -409,6 +719,91 @@ def add_item_to_plan(
         else:
             lines.insert(last_checkbox_idx + 1, new_item)
 
+
+def _remove_item_lines(lines: list[str], index: _PlanIndex, item_pattern: str) -> None:
+    """Remove a checklist item from plan lines in place.
+
+    Args:
+        lines: Plan content split into lines (modified in place)
+        index: Parsed plan, matching lines before the edit
+        item_pattern: Pattern to match (case-insensitive, partial match)
+    """
+    # Find and remove first matching checkbox item
+    checkbox = _find_indexed_checkbox(index, item_pattern)
+    if checkbox is not None:
+        del lines[checkbox[0]]
+
+
+def _rename_item_lines(
+    lines: list[str], index: _PlanIndex, old_text: str, new_text: str
+) -> None:
+    """Rename a checklist item in plan lines in place.
+
+    Args:
+        lines: Plan content split into lines (modified in place)
+        index: Parsed plan, matching lines before the edit
+        old_text: Current item text (partial match)
+        new_text: New item text
+    """
+    # Find and rename first matching checkbox item
+    checkbox = _find_indexed_checkbox(index, old_text)
+    if checkbox is not None:
+        line_num = checkbox[0]
+        line = lines[line_num]
+        # Preserve checkbox state and indentation
+        match = _match_checkbox(line)
+        assert match is not None  # The index only lists checkbox lines
+        lines[line_num] = f"{line[: match[1]]} {new_text}"
+
+
+def _add_phase_lines(
+    lines: list[str],
+    phase_name: str,
+    items: list[str] | None = None,
+) -> None:
+    """Add a new phase section to plan lines in place.
+
+    Args:
+        lines: Plan content split into lines (modified in place)
+        phase_name: Name of new phase (e.g., "Phase 3: Deployment")
+        items: Optional list of initial checklist items
+    """
+    # Find where to insert (before ## sections that aren't ###)
+    insert_idx = len(lines)
+    for i, line in enumerate(lines):
+        if line.startswith("##") and not line.startswith("###"):
+            insert_idx = i
+            break
+
+    # Build phase section
+    phase_lines = [f"### {phase_name}"]
+    if items:
+        for item in items:
+            phase_lines.append(f"- [ ] {item}")
+    phase_lines.append("")  # Blank line after phase
+
+    # Insert phase (slice assignment shifts the tail once, not per line)
+    lines[insert_idx:insert_idx] = phase_lines
+
+
+def add_item_to_plan(
+    plan_content: str,
+    item_text: str,
+    phase: str | None = None,
+) -> str:
+    """Add a new checklist item to plan.
+
+    Args:
+        plan_content: Current plan content
+        item_text: Text of new item (without checkbox)
+        phase: Phase name to add to (default: last phase)
+
+    Returns:
+        Updated plan content
+    """
+    index = _parse_plan(plan_content)
+    lines = list(index.lines)
+    _add_item_lines(lines, index, item_text, phase)
     return "\n".join(lines)
 
 
@@ -425,15 +820,9 @@ def remove_item_from_plan(
     Returns:
         Updated plan content with item removed
     """
-    lines = plan_content.split("\n")
-    pattern_lower = item_pattern.lower()
-
-    # Find and remove first matching checkbox item
-    for i, line in enumerate(lines):
-        if re.match(r"^\s*-\s*\[([ x])\]", line) and pattern_lower in line.lower():
-            lines.pop(i)
-            break
-
+    index = _parse_plan(plan_content)
+    lines = list(index.lines)
+    _remove_item_lines(lines, index, item_pattern)
     return "\n".join(lines)
 
 
@@ -452,18 +841,9 @@ def rename_item_in_plan(
     Returns:
         Updated plan content with item renamed
     """
-    lines = plan_content.split("\n")
-    old_lower = old_text.lower()
-
-    # Find and rename first matching checkbox item
-    for i, line in enumerate(lines):
-        match = re.match(r"^(\s*-\s*\[([ x])\])\s*(.*)$", line)
-        if match and old_lower in line.lower():
-            # Preserve checkbox state and indentation
-            checkbox_part = match.group(1)
-            lines[i] = f"{checkbox_part} {new_text}"
-            break
-
+    index = _parse_plan(plan_content)
+    lines = list(index.lines)
+    _rename_item_lines(lines, index, old_text, new_text)
     return "\n".join(lines)
 
 
@@ -483,25 +863,7 @@ def add_phase_to_plan(
         Updated plan content with new phase
     """
     lines = plan_content.split("\n")
-
-    # Find where to insert (before ## sections that aren't ###)
-    insert_idx = len(lines)
-    for i, line in enumerate(lines):
-        if line.startswith("##") and not line.startswith("###"):
-            insert_idx = i
-            break
-
-    # Build phase section
-    phase_lines = [f"### {phase_name}"]
-    if items:
-        for item in items:
-            phase_lines.append(f"- [ ] {item}")
-    phase_lines.append("")  # Blank line after phase
-
-    # Insert phase
-    for j, phase_line in enumerate(phase_lines):
-        lines.insert(insert_idx + j, phase_line)
-
+    _add_phase_lines(lines, phase_name, items)
     return "\n".join(lines)
 
 
@@ -559,7 +921,7 @@ def update_plan(
         sys.exit(1)
 
     # Read current content
-    content = plan_file.read_text()
+    content = plan_file.read_text(encoding="utf-8")
 
     # If show flag, display plan with progress
     if show:
@@ -575,8 +937,10 @@ def update_plan(
     is_edit_mode = any([add, remove, rename, add_phase])
 
     if is_edit_mode:
-        # EDIT MODE: Handle add/remove/rename operations
-        new_content = content
+        # EDIT MODE: Handle add/remove/rename operations. The plan is parsed
+        # once, a copy of its lines edited in place and joined for writing
+        index = _parse_plan(content)
+        lines = list(index.lines)
 
         # Handle add operation
         if add:
@@ -587,25 +951,25 @@ def update_plan(
                 sys.exit(1)
 
             # Validate phase exists (if specified)
-            phase_error = validate_phase_exists(new_content, phase)
+            phase_error = None if phase is None else _indexed_phase_error(index, phase)
             if phase_error:
                 print_error(phase_error)
                 sys.exit(1)
 
             # Validate no duplicates
-            duplicate_error = validate_no_duplicates(new_content, add)
+            duplicate_error = validate_no_duplicates(content, add)
             if duplicate_error:
                 print_error(duplicate_error)
                 sys.exit(1)
 
-            new_content = add_item_to_plan(new_content, add, phase=phase)
+            _add_item_lines(lines, index, add, phase=phase)
             action = f"Added item: {add}"
             if phase:
                 action += f" to {phase}"
 
         # Handle remove operation
         elif remove:
-            new_content = remove_item_from_plan(new_content, remove)
+            _remove_item_lines(lines, index, remove)
             action = f"Removed item: {remove}"
 
         # Handle rename operation
@@ -620,26 +984,27 @@ def update_plan(
                 print_error(empty_error)
                 sys.exit(1)
 
-            new_content = rename_item_in_plan(new_content, rename, to)
+            _rename_item_lines(lines, index, rename, to)
             action = f"Renamed item: {rename} -> {to}"
 
         # Handle add-phase operation
         elif add_phase:
-            new_content = add_phase_to_plan(new_content, add_phase)
+            _add_phase_lines(lines, add_phase)
             action = f"Added phase: {add_phase}"
 
         # Write back to file
-        plan_file.write_text(new_content)
+        content = "\n".join(lines)
+        plan_file.write_text(content, encoding="utf-8")
 
-        # Log the update
+        # Log the update to the session already resolved above
         try:
-            log_execution(action, level="success")
+            log_execution(action, level="success", session_id=session_id)
         except SystemExit:
             # If logging fails, continue anyway
             pass
 
         # Display success message
-        checked, total = count_checkboxes(new_content)
+        checked, total = count_checkboxes(content)
         percentage = int((checked / total) * 100) if total > 0 else 0
 
         print_success(f"Updated plan for session {session_id}:")
@@ -655,55 +1020,61 @@ def update_plan(
         print_error("Item text must be provided (or use --show)")
         sys.exit(1)
 
-    # Find checkbox
-    result = find_checkbox_line(content, item)
+    # Index the plan once; lookup, toggle, progress and section all use it
+    index = _parse_plan(content)
+    result = _find_indexed_checkbox(index, item)
 
     if result is None:
         print_error(f"Checkbox item not found: {item}")
 
         # Show fuzzy suggestions
-        all_items = extract_all_checkbox_items(content)
-        suggestions = find_similar_items(item, all_items, threshold=0.5)
+        all_items = [text for _, _, text in index.checkboxes]
+        # Show top 3 suggestions
+        suggestions = find_similar_items(item, all_items, threshold=0.5, limit=3)
 
         if suggestions:
             print("\nDid you mean:")
-            # Show top 3 suggestions
-            for suggested_item, similarity in suggestions[:3]:
+            for suggested_item, similarity in suggestions:
                 print(f"  • {suggested_item} (similarity: {similarity:.0%})")
 
         print("\nUse 'ai-update-plan --show' to see all items")
         sys.exit(1)
 
-    line_num, old_line = result
+    line_num, was_checked, _ = result
+    old_line = index.lines[line_num]
 
     # Update checkbox
     should_check = check and not uncheck
     new_line = toggle_checkbox(old_line, should_check)
 
-    # Replace in content
-    lines = content.split("\n")
+    # Edit a copy so the frozen index keeps describing the parsed content
+    lines = list(index.lines)
     lines[line_num] = new_line
-    new_content = "\n".join(lines)
 
-    # Write back
-    plan_file.write_text(new_content)
+    # Write back, unless the box was already in the requested state
+    if new_line != old_line:
+        plan_file.write_text("\n".join(lines), encoding="utf-8")
 
-    # Log the update
+    # Log the update to the session already resolved above
     action = "Checked" if should_check else "Unchecked"
     try:
-        log_execution(f"{action} plan item: {item}", level="success")
+        log_execution(
+            f"{action} plan item: {item}", level="success", session_id=session_id
+        )
     except SystemExit:
         # If logging fails, continue anyway
         pass
 
-    # Display updated section
-    checked, total = count_checkboxes(new_content)
+    # Display updated section; toggling changes one checkbox and no headers,
+    # so progress and section bounds follow from the original index
+    checked = index.checked - was_checked + should_check
+    total = len(index.checkboxes)
     percentage = int((checked / total) * 100) if total > 0 else 0
 
     print_success(f"Updated plan for session {session_id}:")
     print()
-    section = extract_phase_section(new_content, line_num)
-    print(section)
+    phase_start, phase_end = _indexed_phase_bounds(index, line_num)
+    print("\n".join(lines[phase_start:phase_end]))
     print()
     print(f"Progress: {checked}/{total} items complete ({percentage}%)")
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -101,29 +103,41 @@ def create_session_filename(session_id: str, file_type: str, task_name: str) ->
     return f"{session_id}-{file_type.upper()}-{slug}.md"
 
 
+def _list_session_files(sessions_dir: Path) -> list[str]:
+    """List the file names in the sessions directory with one scandir pass.
+
+    Callers filter the names with ``fnmatch`` (the matching ``glob`` uses),
+    so several patterns cost one directory read instead of one each.
+
+    Args:
+        sessions_dir: Sessions directory
+
+    Returns:
+        Names of the entries in the directory, or an empty list if it
+        cannot be read (missing, not a directory, ...), as ``glob`` does
+    """
+    try:
+        with os.scandir(sessions_dir) as entries:
+            return [entry.name for entry in entries]
+    except OSError:
+        return []
+
+
 def get_current_session() -> str | None:
     """Get the most recent session ID.
 
     Returns:
         Session ID of most recent session, or None if no sessions exist
     """
-    sessions_dir = get_sessions_dir()
-
-    if not sessions_dir.exists():
-        return None
-
     # Find all PLAN files (one per session)
-    plan_files = list(sessions_dir.glob("*-PLAN-*.md"))
+    plan_files = fnmatch.filter(_list_session_files(get_sessions_dir()), "*-PLAN-*.md")
 
     if not plan_files:
         return None
 
-    # Sort by filename (which starts with timestamp)
-    plan_files.sort(reverse=True)
-
-    # Extract session ID from filename (first 14 characters)
-    latest_file = plan_files[0].name
-    return latest_file[:14]
+    # The latest filename (which starts with timestamp) holds the session
+    # ID in its first 14 characters
+    return max(plan_files)[:14]
 
 
 def get_session_files(session_id: str) -> dict[str, Path | None]:
@@ -136,17 +150,15 @@ def get_session_files(session_id: str) -> dict[str, Path | None]:
         Dictionary with keys 'plan', 'summary', 'execution' and Path values
     """
     sessions_dir = get_sessions_dir()
+    names = _list_session_files(sessions_dir)
 
     # Find files matching this session ID
-    plan_file = list(sessions_dir.glob(f"{session_id}-PLAN-*.md"))
-    summary_file = list(sessions_dir.glob(f"{session_id}-SUMMARY-*.md"))
-    execution_file = list(sessions_dir.glob(f"{session_id}-EXECUTION-*.md"))
+    files: dict[str, Path | None] = {}
+    for key in ("plan", "summary", "execution"):
+        matches = fnmatch.filter(names, f"{session_id}-{key.upper()}-*.md")
+        files[key] = sessions_dir / matches[0] if matches else None
 
-    return {
-        "plan": plan_file[0] if plan_file else None,
-        "summary": summary_file[0] if summary_file else None,
-        "execution": execution_file[0] if execution_file else None,
-    }
+    return files
 
 
 def read_context_file(filename: str) -> str:
@@ -164,7 +176,7 @@ def read_context_file(filename: str) -> str:
     if not file_path.exists():
         return ""
 
-    return file_path.read_text()
+    return file_path.read_text(encoding="utf-8")
 
 
 def write_context_file(filename: str, content: str) -> None:
@@ -180,7 +192,7 @@ def write_context_file(filename: str, content: str) -> None:
     # Ensure directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    file_path.write_text(content)
+    file_path.write_text(content, encoding="utf-8")
 
 
 def append_to_file(file_path: Path, content: str) -> None:
@@ -190,7 +202,7 @@ def append_to_file(file_path: Path, content: str) -> None:
         file_path: Path to file
         content: Content to append
     """
-    with file_path.open("a") as f:
+    with file_path.open("a", encoding="utf-8") as f:
         f.write(content)
 
 
@@ -209,51 +221,47 @@ def format_timestamp(dt: datetime | None = None) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def get_recent_sessions(count: int = 5) -> list[dict[str, Any]]:
+def get_recent_sessions(
+    count: int = 5, with_content: bool = True
+) -> list[dict[str, Any]]:
     """Get information about recent sessions.
 
     Args:
         count: Number of recent sessions to get
+        with_content: Whether to read each summary file into "content";
+            callers that only list sessions can skip those reads
 
     Returns:
         List of session info dictionaries
     """
     sessions_dir = get_sessions_dir()
 
-    if not sessions_dir.exists():
-        return []
-
     # Find all SUMMARY files
-    summary_files = list(sessions_dir.glob("*-SUMMARY-*.md"))
-
-    if not summary_files:
-        return []
+    summary_files = fnmatch.filter(_list_session_files(sessions_dir), "*-SUMMARY-*.md")
 
     # Sort by filename (timestamp)
     summary_files.sort(reverse=True)
 
-    # Get the most recent N
-    recent_files = summary_files[:count]
-
     sessions = []
-    for summary_file in recent_files:
+    # Get the most recent N
+    for filename in summary_files[:count]:
         # Extract session ID and task name
-        filename = summary_file.name
+        summary_file = sessions_dir / filename
         session_id = filename[:14]
         parts = filename[:-3].split("-", 2)  # Remove .md and split
         task_slug = parts[2] if len(parts) > 2 else "unknown"
 
+        session: dict[str, Any] = {
+            "session_id": session_id,
+            "task_slug": task_slug,
+            "summary_file": summary_file,
+        }
+
         # Read summary for details
-        content = summary_file.read_text()
-
-        sessions.append(
-            {
-                "session_id": session_id,
-                "task_slug": task_slug,
-                "summary_file": summary_file,
-                "content": content,
-            }
-        )
+        if with_content:
+            session["content"] = summary_file.read_text(encoding="utf-8")
+
+        sessions.append(session)
 
     return sessions
 
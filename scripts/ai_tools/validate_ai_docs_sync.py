@@ -92,8 +92,8 @@ def compare_files(
         Tuple of (files_are_same, diff_output)
     """
     try:
-        content1 = file1.read_text().splitlines(keepends=True)
-        content2 = file2.read_text().splitlines(keepends=True)
+        content1 = file1.read_text(encoding="utf-8").splitlines(keepends=True)
+        content2 = file2.read_text(encoding="utf-8").splitlines(keepends=True)
 
         # If comparing with template, strip .jinja-specific syntax for comparison
         # This is simplified - real implementation would need proper Jinja parsing
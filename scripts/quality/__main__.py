@@ -0,0 +1,40 @@
+"""Single entry point for the quality tools: ``python -m scripts.quality``."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+
+# Subcommands, each backed by the main() of the module of the same name
+COMMANDS = ("check", "format", "lint", "security", "test")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Dispatch to the quality tool named on the command line.
+
+    Only the selected tool's module is imported. Remaining arguments are
+    handed to it as its own command line, so ``python -m scripts.quality
+    lint --fix`` behaves exactly like ``quality-lint --fix``.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``)
+
+    Returns:
+        Exit code of the selected tool
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.quality",
+        description="Run a quality tool",
+    )
+    parser.add_argument("command", choices=COMMANDS, help="Tool to run")
+    args, rest = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+
+    module = importlib.import_module(f"scripts.quality.{args.command}")
+    sys.argv = [f"quality-{args.command}", *rest]
+    exit_code: int = module.main()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
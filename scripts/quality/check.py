@@ -8,48 +8,55 @@ from scripts.quality.format import format_code
 from scripts.quality.lint import lint_code
 from scripts.quality.test import run_tests
 
+# Rule printed above and below each stage banner
+_BAR = "=" * 60
+
 
 def run_all_checks() -> int:
     """Run all quality checks in sequence.
 
     Runs: format, lint, test (with coverage)
 
+    The stages stay sequential on purpose: formatting rewrites files in
+    place, so linting concurrently would check stale or half-written
+    sources, and each stage only starts once the previous one passed.
+
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("STEP 1/3: Code Formatting")
-    print("=" * 60)
+    print(_BAR)
 
     result = format_code(check=False)
     if result != 0:
         print("\n❌ Quality check failed at: formatting")
         return result
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("STEP 2/3: Code Linting")
-    print("=" * 60)
+    print(_BAR)
 
     result = lint_code(fix=False)
     if result != 0:
         print("\n❌ Quality check failed at: linting")
         return result
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("STEP 3/3: Tests with Coverage")
-    print("=" * 60)
+    print(_BAR)
 
     result = run_tests(coverage=True, verbose=False)
     if result != 0:
         print("\n❌ Quality check failed at: tests")
         return result
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("✅ ALL QUALITY CHECKS PASSED!")
-    print("=" * 60)
+    print(_BAR)
     print("\nSummary:")
     print("  ✅ Code formatting")
-    print("  ✅ Code linting (ruff, mypy, pylint)")
+    print("  ✅ Code linting (ruff, mypy)")
     print("  ✅ Tests with coverage")
     print("\nYour code meets all quality standards!")
     print()
@@ -63,12 +70,12 @@ def main() -> int:
     Returns:
         Exit code
     """
-    print("=" * 60)
+    print(_BAR)
     print("Running Complete Quality Check")
-    print("=" * 60)
+    print(_BAR)
     print("\nThis will run:")
     print("  1. Code formatting (black, isort)")
-    print("  2. Code linting (ruff, mypy, pylint)")
+    print("  2. Code linting (ruff, mypy)")
     print("  3. Tests with coverage")
     print()
 
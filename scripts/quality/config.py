@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory.
 
+    The result is cached: the root does not move during a run.
+
     Returns:
         Path to the project root (directory containing pyproject.toml)
     """
@@ -24,9 +28,14 @@ def get_project_root() -> Path:
     return Path.cwd()
 
 
+@lru_cache(maxsize=1)
 def load_quality_config() -> dict[str, Any]:
     """Load quality configuration from pyproject.toml.
 
+    The file is parsed once per process and the result cached, so a
+    ``make check`` run sharing it across format, lint and test reads it
+    only once. Treat the returned dictionary as read-only.
+
     Returns:
         Dictionary containing quality tool configuration
 
@@ -60,10 +69,40 @@ def get_code_paths() -> list[str]:
         List of directory paths to check
     """
     config = load_quality_config()
-    paths: list[str] = config.get("code_paths", ["src", "tests"])
+    # Copy so callers cannot mutate the cached configuration
+    paths: list[str] = list(config.get("code_paths", ["src", "tests"]))
     return paths
 
 
+@lru_cache(maxsize=1)
+def _collect_code_files() -> tuple[str, ...]:
+    """Walk the code paths once and collect their Python files.
+
+    Returns:
+        Sorted tuple of Python file paths under the configured code paths
+    """
+    files: list[str] = []
+    for root in get_code_paths():
+        root_path = Path(root)
+        if root_path.is_file():
+            files.append(root)
+        else:
+            files.extend(str(path) for path in root_path.rglob("*.py"))
+    return tuple(sorted(files))
+
+
+def get_code_files() -> list[str]:
+    """Get the Python files under the configured code paths.
+
+    The directory walk is cached, so every linter in a run can be handed
+    the same materialized list instead of rescanning the tree itself.
+
+    Returns:
+        List of Python file paths
+    """
+    return list(_collect_code_files())
+
+
 def get_test_paths() -> list[str]:
     """Get list of paths containing tests.
 
@@ -71,7 +110,8 @@ def get_test_paths() -> list[str]:
         List of test directory paths
     """
     config = load_quality_config()
-    paths: list[str] = config.get("test_paths", ["tests"])
+    # Copy so callers cannot mutate the cached configuration
+    paths: list[str] = list(config.get("test_paths", ["tests"]))
     return paths
 
 
@@ -92,5 +132,6 @@ if __name__ == "__main__":
     print("=" * 50)
     print(f"Project Root: {get_project_root()}")
     print(f"Code Paths: {get_code_paths()}")
+    print(f"Code Files: {len(get_code_files())}")
     print(f"Test Paths: {get_test_paths()}")
     print(f"Min Coverage: {get_min_coverage()}%")
@@ -1,15 +1,22 @@
-"""Code linting with ruff, mypy, and pylint - single source of truth."""
+"""Code linting with ruff and mypy - single source of truth."""
 
 from __future__ import annotations
 
 import subprocess
 import sys
 
-from scripts.quality.config import get_code_paths
+from scripts.quality.config import get_code_files, get_code_paths, get_project_root
+
+# Above this many files, hand the linters directories instead so the
+# command line stays well under the OS argument-length limit
+_MAX_FILE_ARGS = 2000
 
 
 def lint_code(fix: bool = False) -> int:
-    """Lint code with ruff, mypy, and pylint.
+    """Lint code with ruff and mypy.
+
+    Pylint's checks run inside ruff through the ``PL`` rule family, which
+    saves a separate interpreter start and a second parse of the tree.
 
     Args:
         fix: If True, auto-fix issues where possible (ruff only)
@@ -20,47 +27,49 @@ def lint_code(fix: bool = False) -> int:
     paths = get_code_paths()
     paths_str = " ".join(paths)
 
-    print("Linting code with ruff, mypy, and pylint...")
+    # Give ruff the pre-walked file list so it does not rescan the tree;
+    # fall back to the directories when it is empty (ruff would otherwise
+    # lint the cwd) or too long for one command
+    files = get_code_files()
+    targets = files if 0 < len(files) <= _MAX_FILE_ARGS else paths
+
+    print("Linting code with ruff and mypy...")
     print(f"Paths: {paths_str}")
     if fix:
         print("Auto-fix mode: enabled (ruff only)")
     print()
 
     # Run ruff
-    ruff_args = ["ruff", "check"]
+    # --force-exclude keeps ruff's exclude list in effect for explicit files
+    ruff_args = ["ruff", "check", "--force-exclude"]
     if fix:
         ruff_args.append("--fix")
-    ruff_args.extend(paths)
+    ruff_args.extend(targets)
 
-    print(f"Running: {' '.join(ruff_args)}")
+    # The linters inherit our stdout and stream straight to it; flush our
+    # own buffered banner first so piped logs (CI) keep it in order
+    print(f"Running: {' '.join(ruff_args)}", flush=True)
     result = subprocess.run(ruff_args, check=False)
 
     if result.returncode != 0:
         print("\n❌ Ruff linting failed")
         return result.returncode
 
-    # Run mypy
-    mypy_args = ["mypy"]
+    # Run mypy against a cache pinned to the project root, so runs from
+    # any directory (and CI restores) reuse the parsed dependency stubs
+    mypy_cache = get_project_root() / ".mypy_cache"
+    mypy_args = ["mypy", "--cache-dir", str(mypy_cache), "--sqlite-cache"]
+    # Always the directories: mypy applies its exclude list only to files it
+    # discovers itself, so explicit file names would bypass it
     mypy_args.extend(paths)
 
-    print(f"\nRunning: {' '.join(mypy_args)}")
+    print(f"\nRunning: {' '.join(mypy_args)}", flush=True)
     result = subprocess.run(mypy_args, check=False)
 
     if result.returncode != 0:
         print("\n❌ MyPy type checking failed")
         return result.returncode
 
-    # Run pylint
-    pylint_args = ["pylint"]
-    pylint_args.extend(paths)
-
-    print(f"\nRunning: {' '.join(pylint_args)}")
-    result = subprocess.run(pylint_args, check=False)
-
-    if result.returncode != 0:
-        print("\n❌ Pylint checking failed")
-        return result.returncode
-
     print("\n✅ All linting checks passed!")
     return 0
 
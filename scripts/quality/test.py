@@ -8,12 +8,20 @@ import sys
 from scripts.quality.config import get_min_coverage, get_test_paths
 
 
-def run_tests(coverage: bool = False, verbose: bool = False) -> int:
+def run_tests(
+    coverage: bool = False, verbose: bool = False, workers: str | None = "auto"
+) -> int:
     """Run tests with pytest.
 
+    Tests are spread over pytest-xdist workers, one file per worker at a
+    time, so fixtures scoped to a module stay on a single process.
+    pytest-cov merges the workers' coverage data on its own.
+
     Args:
         coverage: If True, run with coverage reporting
         verbose: If True, run with verbose output
+        workers: xdist worker count ("auto" for one per CPU), or None to
+            run in a single process
 
     Returns:
         Exit code (0 for success, non-zero for failure)
@@ -23,11 +31,12 @@ def run_tests(coverage: bool = False, verbose: bool = False) -> int:
 
     print("Running tests with pytest...")
     print(f"Test paths: {paths_str}")
+    min_cov = get_min_coverage() if coverage else None
     if coverage:
-        min_cov = get_min_coverage()
         print(f"Coverage reporting: enabled (minimum {min_cov}%)")
     if verbose:
         print("Verbose mode: enabled")
+    print(f"Workers: {workers or 'serial'}")
     print()
 
     # Build pytest command
@@ -36,8 +45,10 @@ def run_tests(coverage: bool = False, verbose: bool = False) -> int:
     if verbose:
         pytest_args.append("-v")
 
+    if workers:
+        pytest_args.extend(["-n", workers, "--dist=loadfile"])
+
     if coverage:
-        min_cov = get_min_coverage()
         pytest_args.extend(
             [
                 "--cov=src",
@@ -49,7 +60,9 @@ def run_tests(coverage: bool = False, verbose: bool = False) -> int:
 
     pytest_args.extend(test_paths)
 
-    print(f"Running: {' '.join(pytest_args)}")
+    # pytest streams straight to the inherited stdout; flush the banner
+    # first so it is not reordered after pytest's output when piped
+    print(f"Running: {' '.join(pytest_args)}", flush=True)
     result = subprocess.run(pytest_args, check=False)
 
     if result.returncode != 0:
@@ -60,6 +73,24 @@ def run_tests(coverage: bool = False, verbose: bool = False) -> int:
     return 0
 
 
+def _parse_workers(argv: list[str]) -> str | None:
+    """Read the xdist worker count from command-line arguments.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        Worker count from ``-n N``, None for ``--serial``, else "auto"
+    """
+    if "--serial" in argv:
+        return None
+    if "-n" in argv:
+        index = argv.index("-n")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return "auto"
+
+
 def main() -> int:
     """Main entry point for test command.
 
@@ -68,12 +99,13 @@ def main() -> int:
     """
     coverage_mode = "--coverage" in sys.argv
     verbose_mode = "-v" in sys.argv or "--verbose" in sys.argv
+    workers = _parse_workers(sys.argv)
 
     print("=" * 60)
     print("Running Tests")
     print("=" * 60)
 
-    return run_tests(coverage=coverage_mode, verbose=verbose_mode)
+    return run_tests(coverage=coverage_mode, verbose=verbose_mode, workers=workers)
 
 
 if __name__ == "__main__":
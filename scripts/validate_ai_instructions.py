@@ -8,6 +8,7 @@ across all platforms and that critical TDD/quality rules are present.
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -30,21 +31,24 @@ REQUIRED_FILES = [
 ]
 
 # Critical keywords that MUST appear in instruction files
-REQUIRED_KEYWORDS = [
+REQUIRED_KEYWORDS = (
     "TDD",  # Test-Driven Development
     "test",  # Testing
     "make check",  # Quality gate
     "coverage",  # Code coverage
     "type hint",  # Type safety
     "mock",  # Mocking guidance
-]
+)
 
 # Critical phrases for TDD
-CRITICAL_TDD_PHRASES = [
+CRITICAL_TDD_PHRASES = (
     "test",  # Must mention tests
     "before",  # Tests before implementation
     "coverage",  # Coverage requirements
-]
+)
+
+# Ways a file can state the 80% coverage requirement (already lowercase)
+COVERAGE_REQUIREMENT_TOKENS = ("80%", "80 percent")
 
 
 def get_project_root() -> Path:
@@ -71,99 +75,149 @@ def check_file_exists(file_path: Path) -> ValidationResult:
     return ValidationResult(False, f"❌ {file_path.name} is missing")
 
 
-def check_file_content(file_path: Path, keywords: list[str]) -> ValidationResult:
+def load_instruction_files(
+    root: Path, files: list[str]
+) -> tuple[dict[str, str], list[ValidationResult]]:
+    """Read each existing instruction file once, lowercased.
+
+    Args:
+        root: Project root directory
+        files: List of file paths to read
+
+    Returns:
+        Tuple of (mapping of file path to lowercased content for files
+        that were read, failed results for files that exist but could
+        not be read)
+    """
+    # Reading sequentially on purpose: the files are a few kB each, so
+    # worker-thread startup would cost more than the reads themselves.
+    # Asking for forgiveness skips a separate stat per file
+    contents: dict[str, str] = {}
+    errors: list[ValidationResult] = []
+    for file_rel_path in files:
+        file_path = root / file_rel_path
+        try:
+            contents[file_rel_path] = file_path.read_text(encoding="utf-8").lower()
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append(
+                ValidationResult(False, f"❌ Error reading {file_path.name}: {e}")
+            )
+    return contents, errors
+
+
+@lru_cache(maxsize=8)
+def _lowercase_all(words: tuple[str, ...]) -> tuple[str, ...]:
+    """Lowercase a keyword tuple once and reuse it for every file.
+
+    Args:
+        words: Keywords as written in the constants
+
+    Returns:
+        The same keywords, lowercased
+    """
+    return tuple(word.lower() for word in words)
+
+
+def check_file_content(
+    file_name: str, content: str, keywords: tuple[str, ...]
+) -> ValidationResult:
     """Check if file contains required keywords.
 
     Args:
-        file_path: Path to file
-        keywords: List of required keywords
+        file_name: Name of the file, for messages
+        content: Lowercased file content
+        keywords: Tuple of required keywords
 
     Returns:
         ValidationResult indicating if keywords are present
     """
-    try:
-        content = file_path.read_text().lower()
-        missing = [kw for kw in keywords if kw.lower() not in content]
-
-        if missing:
-            return ValidationResult(
-                False,
-                f"❌ {file_path.name} missing keywords: {', '.join(missing)}",
-            )
+    # Separate ``in`` scans use CPython's fast substring search and beat a
+    # single keyword alternation regex, which steps through every match
+    missing = [
+        kw
+        for kw, kw_lower in zip(keywords, _lowercase_all(keywords), strict=True)
+        if kw_lower not in content
+    ]
+
+    if missing:
         return ValidationResult(
-            True, f"✅ {file_path.name} contains all required keywords"
+            False,
+            f"❌ {file_name} missing keywords: {', '.join(missing)}",
         )
-    except OSError as e:
-        return ValidationResult(False, f"❌ Error reading {file_path.name}: {e}")
+    return ValidationResult(True, f"✅ {file_name} contains all required keywords")
 
 
-def check_tdd_emphasis(file_path: Path) -> ValidationResult:
-    """Check if file emphasizes TDD principles.
+def _count_up_to(content: str, word: str, limit: int) -> int:
+    """Count non-overlapping occurrences of a word, stopping at a limit.
 
     Args:
-        file_path: Path to file
+        content: Text to search
+        word: Word to count
+        limit: Count at which to stop searching
 
     Returns:
-        ValidationResult indicating TDD emphasis
+        Number of occurrences, capped at ``limit``
     """
-    try:
-        content = file_path.read_text().lower()
+    count = 0
+    index = content.find(word)
+    while index != -1 and count < limit:
+        count += 1
+        index = content.find(word, index + len(word))
+    return count
 
-        # Count occurrences of critical TDD phrases
-        test_count = content.count("test")
-        first_count = content.count("first") + content.count("before")
 
-        if test_count < 5:
-            return ValidationResult(
-                False,
-                f"⚠️  {file_path.name} mentions 'test' only "
-                f"{test_count} times (expected 5+)",
-            )
+def check_tdd_emphasis(file_name: str, content: str) -> ValidationResult:
+    """Check if file emphasizes TDD principles.
 
-        if first_count < 2:
-            return ValidationResult(
-                False,
-                f"⚠️  {file_path.name} doesn't emphasize 'tests first' enough",
-            )
+    Args:
+        file_name: Name of the file, for messages
+        content: Lowercased file content
 
+    Returns:
+        ValidationResult indicating TDD emphasis
+    """
+    # Count occurrences of critical TDD phrases only up to the thresholds:
+    # a passing file usually hits them in its first few kB, and below a
+    # threshold the capped count is exact for the messages. str.find
+    # outruns one combined regex for the same reason as check_file_content
+    test_count = _count_up_to(content, "test", 5)
+    first_count = _count_up_to(content, "first", 2)
+    if first_count < 2:
+        first_count += _count_up_to(content, "before", 2 - first_count)
+
+    if test_count < 5:
         return ValidationResult(
-            True, f"✅ {file_path.name} emphasizes TDD appropriately"
+            False,
+            f"⚠️  {file_name} mentions 'test' only {test_count} times (expected 5+)",
         )
-    except OSError as e:
+
+    if first_count < 2:
         return ValidationResult(
-            False, f"❌ Error checking TDD in {file_path.name}: {e}"
+            False,
+            f"⚠️  {file_name} doesn't emphasize 'tests first' enough",
         )
 
+    return ValidationResult(True, f"✅ {file_name} emphasizes TDD appropriately")
 
-def check_consistency_across_files(root: Path, files: list[str]) -> ValidationResult:
+
+def check_consistency_across_files(contents: dict[str, str]) -> ValidationResult:
     """Check if core concepts are consistent across all files.
 
     Args:
-        root: Project root directory
-        files: List of file paths to check
+        contents: Mapping of existing file path to lowercased content
 
     Returns:
         ValidationResult indicating consistency
     """
-    coverage_requirements = []
-
-    for file_rel_path in files:
-        file_path = root / file_rel_path
-        if not file_path.exists():
-            continue
-
-        try:
-            content = file_path.read_text().lower()
-
-            # Check for coverage percentage
-            if "80%" in content or "80 percent" in content:
-                coverage_requirements.append((file_rel_path, "80%"))
-        except OSError:
-            continue
-
     # All files should mention 80% coverage
-    expected_count = len([f for f in files if (root / f).exists()])
-    actual_count = len(coverage_requirements)
+    expected_count = len(contents)
+    actual_count = sum(
+        1
+        for content in contents.values()
+        if any(token in content for token in COVERAGE_REQUIREMENT_TOKENS)
+    )
 
     if actual_count < expected_count - 1:  # Allow 1 file to not mention it
         return ValidationResult(
@@ -198,31 +252,34 @@ def validate_all() -> bool:
         if not result.passed:
             all_passed = False
 
+    # Read every existing file once; all content checks share the text
+    contents, read_errors = load_instruction_files(root, REQUIRED_FILES)
+
     # Check required keywords in existing files
     print("\n🔑 Required Keywords Check:")
-    for file_path in REQUIRED_FILES:
-        full_path = root / file_path
-        if full_path.exists():
-            result = check_file_content(full_path, REQUIRED_KEYWORDS)
-            results.append(result)
-            print(f"  {result.message}")
-            if not result.passed:
-                all_passed = False
+    for result in read_errors:
+        results.append(result)
+        print(f"  {result.message}")
+        all_passed = False
+    for file_path, content in contents.items():
+        result = check_file_content(Path(file_path).name, content, REQUIRED_KEYWORDS)
+        results.append(result)
+        print(f"  {result.message}")
+        if not result.passed:
+            all_passed = False
 
     # Check TDD emphasis
     print("\n🧪 TDD Emphasis Check:")
-    for file_path in REQUIRED_FILES:
-        full_path = root / file_path
-        if full_path.exists():
-            result = check_tdd_emphasis(full_path)
-            results.append(result)
-            print(f"  {result.message}")
-            if not result.passed:
-                all_passed = False
+    for file_path, content in contents.items():
+        result = check_tdd_emphasis(Path(file_path).name, content)
+        results.append(result)
+        print(f"  {result.message}")
+        if not result.passed:
+            all_passed = False
 
     # Check consistency
     print("\n🔄 Consistency Check:")
-    result = check_consistency_across_files(root, REQUIRED_FILES)
+    result = check_consistency_across_files(contents)
     results.append(result)
     print(f"  {result.message}")
     if not result.passed:
@@ -3,26 +3,27 @@
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
 
-def convert_to_jinja(content: str) -> str:
+def convert_to_jinja(content: bytes) -> bytes:
     """Convert Python code to use Jinja template variables.
 
+    Both names are distinctive enough that plain ``replace`` matches only
+    real references. Working on the raw UTF-8 bytes is safe because the
+    ASCII names cannot match inside a multi-byte character, and it skips
+    decoding and re-encoding every file.
+
     Args:
-        content: Source file content
+        content: Source file content as UTF-8 bytes
 
     Returns:
         Content with template variables replaced
     """
-    # Replace package name references
-    content = re.sub(r"\bpython_modern_template\b", "{{ package_name }}", content)
-
-    # Replace project name references (hyphenated)
-    content = re.sub(r"\bpython-modern-template\b", "{{ project_name }}", content)
-
-    return content
+    # Replace package name references, then project name (hyphenated)
+    return content.replace(b"python_modern_template", b"{{ package_name }}").replace(
+        b"python-modern-template", b"{{ project_name }}"
+    )
 
 
 def sync_file(source: Path, dest: Path, add_jinja_ext: bool = True) -> None:
@@ -34,7 +35,7 @@ def sync_file(source: Path, dest: Path, add_jinja_ext: bool = True) -> None:
         add_jinja_ext: Whether to add .jinja extension
     """
     # Read source content
-    content = source.read_text(encoding="utf-8")
+    content = source.read_bytes()
 
     # Convert to Jinja
     jinja_content = convert_to_jinja(content)
@@ -43,13 +44,20 @@ def sync_file(source: Path, dest: Path, add_jinja_ext: bool = True) -> None:
     if add_jinja_ext and not dest.name.endswith(".jinja"):
         dest = dest.with_suffix(dest.suffix + ".jinja")
 
+    src_rel = source.relative_to(PROJECT_ROOT)
+    dst_rel = dest.relative_to(PROJECT_ROOT)
+
+    # Leave an up-to-date destination alone so its mtime (and any cache
+    # keyed on it) survives a no-op sync
+    if dest.is_file() and dest.read_bytes() == jinja_content:
+        print(f"⏭  Unchanged: {src_rel} → {dst_rel}")
+        return
+
     # Ensure destination directory exists
     dest.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to destination
-    dest.write_text(jinja_content, encoding="utf-8")
-    src_rel = source.relative_to(PROJECT_ROOT)
-    dst_rel = dest.relative_to(PROJECT_ROOT)
+    dest.write_bytes(jinja_content)
     print(f"✅ Synced: {src_rel} → {dst_rel}")
 
 
@@ -116,6 +124,7 @@ def main() -> None:
             "test_update_plan_extended.py",
             "test_update_plan_fuzzy.py",
             "test_update_plan_validation.py",
+            "test_utils.py",
         ],
         PROJECT_ROOT / "tests" / "ai_tools",
         TEMPLATE_ROOT / "tests" / "ai_tools",
@@ -128,6 +137,7 @@ def main() -> None:
             "test_check.py",
             "test_format.py",
             "test_lint.py",
+            "test_main.py",
             "test_security.py",
             "test_test.py",
         ],
@@ -151,7 +161,15 @@ def main() -> None:
 
     # Sync quality scripts
     total += sync_file_list(
-        ["config.py", "check.py", "format.py", "lint.py", "security.py", "test.py"],
+        [
+            "__main__.py",
+            "config.py",
+            "check.py",
+            "format.py",
+            "lint.py",
+            "security.py",
+            "test.py",
+        ],
         PROJECT_ROOT / "scripts" / "quality",
         TEMPLATE_ROOT / "scripts" / "quality",
         "⚙️  Syncing quality scripts...",
@@ -8,11 +8,17 @@ import pytest
 
 
 @pytest.fixture
-def temp_context_dir(tmp_path: Path) -> Path:
+def temp_context_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create temporary .ai-context directory.
 
+    Context lookups are pointed at it for the duration of the test, so a
+    tool that reads or writes a context file the test did not patch never
+    touches the repository's own .ai-context (which parallel xdist workers
+    would otherwise share).
+
     Args:
         tmp_path: Pytest temporary path fixture
+        monkeypatch: Pytest monkeypatch fixture
 
     Returns:
         Path to temporary .ai-context directory
@@ -24,13 +30,19 @@ def temp_context_dir(tmp_path: Path) -> Path:
 
     # Create basic context files
     (context_dir / "LAST_SESSION_SUMMARY.md").write_text(
-        "# Last Session Summary\n\nNo sessions yet.\n"
+        "# Last Session Summary\n\nNo sessions yet.\n",
+        encoding="utf-8",
     )
     (context_dir / "ACTIVE_TASKS.md").write_text(
-        "# Active Tasks\n\n## In Progress\n\n## Blocked\n\n## Completed\n\n"
+        "# Active Tasks\n\n## In Progress\n\n## Blocked\n\n## Completed\n\n",
+        encoding="utf-8",
+    )
+    (context_dir / "RECENT_DECISIONS.md").write_text(
+        "# Recent Decisions\n\n", encoding="utf-8"
     )
-    (context_dir / "RECENT_DECISIONS.md").write_text("# Recent Decisions\n\n")
-    (context_dir / "CONVENTIONS.md").write_text("# Conventions\n\n")
+    (context_dir / "CONVENTIONS.md").write_text("# Conventions\n\n", encoding="utf-8")
+
+    monkeypatch.setattr("scripts.ai_tools.utils.get_context_dir", lambda: context_dir)
 
     return context_dir
 
@@ -73,7 +85,8 @@ def sample_session_files(temp_context_dir: Path) -> dict[str, Path]:
 ### Phase 2: Implementation
 - [ ] Implement functionality
 - [ ] Run tests to confirm they pass
-"""
+""",
+        encoding="utf-8",
     )
 
     summary_file.write_text(
@@ -88,7 +101,8 @@ def sample_session_files(temp_context_dir: Path) -> dict[str, Path]:
 ## What Was Done
 
 [To be filled at end of session]
-"""
+""",
+        encoding="utf-8",
     )
 
     execution_file.write_text(
@@ -104,7 +118,8 @@ def sample_session_files(temp_context_dir: Path) -> dict[str, Path]:
 [2025-11-02 15:00:00] 🎯 Task started: Test Task
 [2025-11-02 15:00:00] 📚 Context loaded successfully
 [2025-11-02 15:00:00] ✅ Session files created
-"""
+""",
+        encoding="utf-8",
     )
 
     return {
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
-from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
+
+import pytest
 
 from scripts.ai_tools.context_summary import main, show_context_summary
 
 
-def test_show_context_summary_basic(temp_context_dir: Path) -> None:
+@pytest.fixture(autouse=True)
+def context_dir(temp_context_dir: Path) -> Path:
+    """Run every test against the temporary context directory.
+
+    Args:
+        temp_context_dir: Temporary context directory, which the context
+            and sessions lookups already point at
+
+    Returns:
+        Path to the temporary .ai-context directory
+    """
+    return temp_context_dir
+
+
+def test_show_context_summary_basic(
+    context_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test basic context summary display."""
     # Update context files with some content
-    (temp_context_dir / "LAST_SESSION_SUMMARY.md").write_text(
+    (context_dir / "LAST_SESSION_SUMMARY.md").write_text(
         """# Last Session Summary
 
 **Session ID**: 20251102150000
@@ -22,10 +38,11 @@ def test_show_context_summary_basic(temp_context_dir: Path) -> None:
 Implemented AI instruction files with TDD
 
 **Status**: ✅ Complete | Files: 12 changed
-"""
+""",
+        encoding="utf-8",
     )
 
-    (temp_context_dir / "ACTIVE_TASKS.md").write_text(
+    (context_dir / "ACTIVE_TASKS.md").write_text(
         """# Active Tasks
 
 ## In Progress
@@ -37,10 +54,11 @@ Implemented AI instruction files with TDD
 
 ## Completed
 - Feature D
-"""
+""",
+        encoding="utf-8",
     )
 
-    (temp_context_dir / "RECENT_DECISIONS.md").write_text(
+    (context_dir / "RECENT_DECISIONS.md").write_text(
         """# Recent Decisions
 
 ## [2025-11-02 14:00] TDD Mandatory
@@ -68,33 +86,25 @@ Implemented AI instruction files with TDD
 **Decision**: All functions must have type hints (mypy strict)
 
 **Status**: ✅ Implemented
-"""
+""",
+        encoding="utf-8",
     )
 
-    (temp_context_dir / "CONVENTIONS.md").write_text(
+    (context_dir / "CONVENTIONS.md").write_text(
         """# Conventions
 
 ## Testing Conventions
 - Tests before code (TDD)
 - Use real code, minimize mocks
 - Run make check before completion
-"""
+""",
+        encoding="utf-8",
     )
 
     # Capture output
-    output = StringIO()
-
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.stdout", output),
-    ):
-        show_context_summary(detailed=False)
+    show_context_summary(detailed=False)
 
-    result = output.getvalue()
+    result = capsys.readouterr().out
 
     # Verify output contains expected sections
     assert "AI Context Summary" in result
@@ -112,10 +122,12 @@ Implemented AI instruction files with TDD
     assert "Type Hints Required" in result
 
 
-def test_show_context_summary_detailed(temp_context_dir: Path) -> None:
+def test_show_context_summary_detailed(
+    context_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test detailed context summary display."""
     # Add content to context files
-    (temp_context_dir / "RECENT_DECISIONS.md").write_text(
+    (context_dir / "RECENT_DECISIONS.md").write_text(
         """# Recent Decisions
 
 ## [2025-11-02 14:00] TDD Mandatory
@@ -128,102 +140,66 @@ def test_show_context_summary_detailed(temp_context_dir: Path) -> None:
 - Better design
 
 **Status**: ✅ Implemented
-"""
+""",
+        encoding="utf-8",
     )
 
-    output = StringIO()
+    show_context_summary(detailed=True)
 
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.stdout", output),
-    ):
-        show_context_summary(detailed=True)
-
-    result = output.getvalue()
+    result = capsys.readouterr().out
 
     # In detailed mode, should show more information
     assert "AI Context Summary" in result
     assert "TDD Mandatory" in result
 
 
-def test_show_context_summary_no_sessions(temp_context_dir: Path) -> None:
+def test_show_context_summary_no_sessions(capsys: pytest.CaptureFixture[str]) -> None:
     """Test context summary when no sessions exist."""
-    output = StringIO()
-
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.stdout", output),
-    ):
-        show_context_summary(detailed=False)
+    show_context_summary(detailed=False)
 
-    result = output.getvalue()
+    result = capsys.readouterr().out
 
     # Should handle missing sessions gracefully
     assert "AI Context Summary" in result
 
 
-def test_show_context_summary_missing_files(tmp_path: Path) -> None:
+def test_show_context_summary_missing_files(
+    context_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test context summary when context files are missing."""
-    # Create minimal context dir without files
-    context_dir = tmp_path / ".ai-context"
-    context_dir.mkdir()
+    # Leave a minimal context dir without files
+    for context_file in context_dir.glob("*.md"):
+        context_file.unlink()
 
-    output = StringIO()
+    show_context_summary(detailed=False)
 
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir", return_value=context_dir
-        ),
-        patch("sys.stdout", output),
-    ):
-        show_context_summary(detailed=False)
-
-    result = output.getvalue()
+    result = capsys.readouterr().out
 
     # Should still display header even if files missing
     assert "AI Context Summary" in result
 
 
-def test_main_default(temp_context_dir: Path) -> None:
+def test_main_default(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test main function with default arguments."""
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.argv", ["ai-context-summary"]),
-    ):
-        # Should run without errors
-        main()
-
-
-def test_main_detailed(temp_context_dir: Path) -> None:
+    monkeypatch.setattr("sys.argv", ["ai-context-summary"])
+
+    # Should run without errors
+    main()
+
+
+def test_main_detailed(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test main function with detailed flag."""
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.argv", ["ai-context-summary", "--detailed"]),
-    ):
-        # Should run without errors
-        main()
-
-
-def test_extract_active_tasks_count(temp_context_dir: Path) -> None:
+    monkeypatch.setattr("sys.argv", ["ai-context-summary", "--detailed"])
+
+    # Should run without errors
+    main()
+
+
+def test_extract_active_tasks_count(
+    context_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Test extraction of active task counts."""
-    (temp_context_dir / "ACTIVE_TASKS.md").write_text(
+    (context_dir / "ACTIVE_TASKS.md").write_text(
         """# Active Tasks
 
 ## In Progress
@@ -237,22 +213,13 @@ def test_extract_active_tasks_count(temp_context_dir: Path) -> None:
 ## Completed
 - Task 5
 - Task 6
-"""
+""",
+        encoding="utf-8",
     )
 
-    output = StringIO()
-
-    with (
-        patch("scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir),
-        patch(
-            "scripts.ai_tools.context_summary.get_context_dir",
-            return_value=temp_context_dir,
-        ),
-        patch("sys.stdout", output),
-    ):
-        show_context_summary(detailed=False)
+    show_context_summary(detailed=False)
 
-    result = output.getvalue()
+    result = capsys.readouterr().out
 
     # Should show task counts
     assert "Active Tasks" in result
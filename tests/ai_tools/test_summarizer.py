@@ -6,11 +6,18 @@ PLAN sections from task descriptions and context.
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 from scripts.ai_tools.summarizer import (
+    _analyze_all,
+    analyze_many,
     analyze_task_type_and_scope,
     extract_file_patterns,
     extract_objective_from_task_description,
     generate_context_summary,
+    has_file_pattern,
     identify_risks_from_description,
 )
 
@@ -81,6 +88,28 @@ class TestExtractObjectiveFromTaskDescription:
         assert "JWT" in objective or "authentication" in objective.lower()
         assert "OAuth" in objective or "oauth" in objective.lower()
 
+    def test_ignores_punctuation_around_action_verb(self) -> None:
+        """Test that punctuation does not hide the leading action verb."""
+        # Arrange
+        task_name = "Fix: login-page crash"
+
+        # Act
+        objective = extract_objective_from_task_description(task_name)
+
+        # Assert
+        assert objective.startswith("Resolve Fix: login-page crash.")
+
+    def test_starts_with_capital_letter(self) -> None:
+        """Test that lowercase task names still produce a capitalized sentence."""
+        # Arrange
+        task_name = "remove legacy config loader"
+
+        # Act
+        objective = extract_objective_from_task_description(task_name)
+
+        # Assert
+        assert objective == "Remove remove legacy config loader."
+
 
 class TestGenerateContextSummary:
     """Tests for generate_context_summary function."""
@@ -139,6 +168,51 @@ class TestGenerateContextSummary:
         # Assert
         assert "Dependencies" in context or "dependencies" in context.lower()
 
+    def test_context_reads_follow_context_directory(
+        self, temp_context_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that cached context reads are keyed on the context directory."""
+        # Arrange
+        (temp_context_dir / "RECENT_DECISIONS.md").unlink()
+        other_dir = tmp_path / "other-context"
+        other_dir.mkdir()
+        (other_dir / "RECENT_DECISIONS.md").write_text("## [2025] Use uv\n")
+
+        # Act
+        with patch(
+            "scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir
+        ):
+            first = generate_context_summary("Add feature", "feature")
+        with patch("scripts.ai_tools.utils.get_context_dir", return_value=other_dir):
+            second = generate_context_summary("Add feature", "feature")
+
+        # Assert
+        assert "No recent decisions recorded yet." in first
+        assert "RECENT_DECISIONS.md" in second
+
+    def test_context_reads_see_later_writes(self, temp_context_dir: Path) -> None:
+        """Test that a context file written or removed later is picked up."""
+        # Arrange
+        decisions_file = temp_context_dir / "RECENT_DECISIONS.md"
+        decisions_file.unlink()
+
+        # Act
+        with patch(
+            "scripts.ai_tools.utils.get_context_dir", return_value=temp_context_dir
+        ):
+            missing = generate_context_summary("Add feature", "feature")
+            decisions_file.write_text("", encoding="utf-8")
+            os.utime(decisions_file, ns=(1_000_000_000, 1_000_000_000))
+            empty = generate_context_summary("Add feature", "feature")
+            decisions_file.write_text("## [2025] Use uv\n", encoding="utf-8")
+            os.utime(decisions_file, ns=(2_000_000_000, 2_000_000_000))
+            written = generate_context_summary("Add feature", "feature")
+
+        # Assert
+        assert "No recent decisions recorded yet." in missing
+        assert "No recent decisions recorded yet." in empty
+        assert "RECENT_DECISIONS.md" in written
+
 
 class TestAnalyzeTaskTypeAndScope:
     """Tests for analyze_task_type_and_scope function."""
@@ -189,6 +263,17 @@ class TestAnalyzeTaskTypeAndScope:
         # Assert
         assert analysis["type"] == "docs"
 
+    def test_matches_whole_words_only(self) -> None:
+        """Test that keywords inside longer words do not change the type."""
+        # Arrange
+        task_name = "Add prefix support to debug logger"
+
+        # Act
+        analysis = analyze_task_type_and_scope(task_name)
+
+        # Assert
+        assert analysis["type"] == "feature"
+
     def test_estimates_scope_from_keywords(self) -> None:
         """Test scope estimation from task keywords."""
         # Arrange
@@ -201,6 +286,19 @@ class TestAnalyzeTaskTypeAndScope:
         assert "scope" in analysis
         assert analysis["scope"] in ["small", "medium", "large"]
 
+    def test_scope_prefers_highest_priority_bucket(self) -> None:
+        """Test that keywords in several scope buckets pick the larger scope."""
+        # Arrange
+        task_name = "Update minor wording in system prompt"
+
+        # Act
+        analysis = analyze_task_type_and_scope(task_name)
+
+        # Assert
+        assert analysis["scope"] == "large"
+        assert analyze_task_type_and_scope("Update user profile")["scope"] == "medium"
+        assert analyze_task_type_and_scope("Add simple toggle")["scope"] == "small"
+
     def test_detects_complexity_indicators(self) -> None:
         """Test detection of complexity indicators."""
         # Arrange
@@ -228,6 +326,28 @@ class TestExtractFilePatterns:
         # Assert
         assert "user_auth.py" in patterns or "user_auth" in str(patterns)
 
+    def test_extracts_yaml_file_patterns(self) -> None:
+        """Test extraction of both YAML file extensions."""
+        # Arrange
+        task_name = "Merge ci.yml into config.yaml"
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert patterns == ["ci.yml", "config.yaml"]
+
+    def test_extracts_file_names_next_to_punctuation(self) -> None:
+        """Test that surrounding punctuation and directories are ignored."""
+        # Arrange
+        task_name = "Sync (user.py), then docs/setup.md."
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert patterns == ["user.py", "setup.md"]
+
     def test_extracts_module_patterns(self) -> None:
         """Test extraction of module name patterns."""
         # Arrange
@@ -239,6 +359,50 @@ class TestExtractFilePatterns:
         # Assert
         assert "authentication" in str(patterns).lower()
 
+    def test_ignores_module_names_with_punctuation(self) -> None:
+        """Test that only identifier-like words are treated as modules."""
+        # Arrange
+        task_name = "Refactor auth-service module"
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert "auth-service" not in patterns
+
+    def test_file_names_are_not_split_into_modules(self) -> None:
+        """Test that a file name before an indicator is reported once."""
+        # Arrange
+        task_name = "Add user_auth.py module"
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert patterns == ["user_auth.py"]
+
+    def test_file_name_stem_is_not_a_module_indicator(self) -> None:
+        """Test that the stem of utils.py does not mark a module."""
+        # Arrange
+        task_name = "Add (utils.py) helper"
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert patterns == ["utils.py"]
+
+    def test_hyphenated_words_are_not_split_into_modules(self) -> None:
+        """Test that part of a hyphenated word is never taken as a module."""
+        # Arrange
+        task_name = "user-auth module refactor"
+
+        # Act
+        patterns = extract_file_patterns(task_name)
+
+        # Assert
+        assert patterns == []
+
     def test_extracts_test_file_patterns(self) -> None:
         """Test extraction of test file patterns."""
         # Arrange
@@ -274,6 +438,20 @@ class TestExtractFilePatterns:
         assert any("user" in p.lower() or "auth" in p.lower() for p in patterns)
 
 
+class TestHasFilePattern:
+    """Tests for has_file_pattern function."""
+
+    def test_detects_explicit_file_name(self) -> None:
+        """Test that a mentioned file name is detected."""
+        # Act & Assert
+        assert has_file_pattern("Fix parsing in config.toml and main.py")
+
+    def test_ignores_tasks_without_file_names(self) -> None:
+        """Test that module names alone do not count as file names."""
+        # Act & Assert
+        assert not has_file_pattern("Refactor authentication module")
+
+
 class TestIdentifyRisksFromDescription:
     """Tests for identify_risks_from_description function."""
 
@@ -349,3 +527,114 @@ class TestIdentifyRisksFromDescription:
 
         # Assert
         assert len(risks) >= 2  # Should identify multiple risk categories
+
+    def test_keywords_inside_longer_words_do_not_trigger_risks(self) -> None:
+        """Test that risk keywords are matched as whole words."""
+        # Arrange
+        task_name = "Add authorization header to dbt exporter"
+
+        # Act
+        risks = identify_risks_from_description(task_name)
+
+        # Assert
+        assert risks == []
+
+    def test_reports_risk_categories_in_fixed_order(self) -> None:
+        """Test that risks are grouped by category in a stable order."""
+        # Arrange
+        task_name = "Update authentication API and database schema"
+
+        # Act
+        risks = identify_risks_from_description(task_name)
+
+        # Assert
+        assert risks[0].startswith("Database changes")
+        assert risks[2].startswith("Security implications")
+        assert risks[4].startswith("API changes may break")
+
+
+class TestAnalyzeAll:
+    """Tests for the combined _analyze_all pipeline."""
+
+    def test_matches_individual_analyzers(self) -> None:
+        """Test that the combined pipeline agrees with each public analyzer."""
+        # Arrange
+        task_name = "Refactor auth module in user_auth.py and add tests"
+
+        # Act
+        result = _analyze_all(task_name, "refactor")
+
+        # Assert
+        assert result["objective"] == extract_objective_from_task_description(task_name)
+        assert result["context"] == generate_context_summary(task_name, "refactor")
+        assert result["analysis"] == analyze_task_type_and_scope(task_name)
+        assert result["file_patterns"] == extract_file_patterns(task_name)
+        assert result["risks"] == identify_risks_from_description(task_name)
+
+    def test_cached_results_are_not_shared_between_callers(self) -> None:
+        """Test that mutating a returned list does not leak into the cache."""
+        # Arrange
+        task_name = "Update database schema"
+        first = identify_risks_from_description(task_name)
+
+        # Act
+        first.clear()
+        second = identify_risks_from_description(task_name)
+
+        # Assert
+        assert len(second) > 0
+
+
+class TestAnalyzeMany:
+    """Tests for analyze_many function."""
+
+    def test_returns_one_result_per_task_in_order(self) -> None:
+        """Test that batch analysis matches per-task analysis."""
+        # Arrange
+        tasks = [
+            ("Fix login error", "bugfix"),
+            ("Update API documentation", "docs"),
+            ("Fix login error", "bugfix"),
+        ]
+
+        # Act
+        results = analyze_many(tasks)
+
+        # Assert
+        assert len(results) == 3
+        assert results[0] == _analyze_all("Fix login error", "bugfix")
+        assert results[1]["analysis"]["type"] == "docs"
+        assert results[2] == results[0]
+
+    def test_returns_empty_list_for_no_tasks(self) -> None:
+        """Test that an empty batch produces no results."""
+        # Act
+        results = analyze_many([])
+
+        # Assert
+        assert results == []
+
+
+class TestBlankTaskNames:
+    """Tests for analyzer fast paths on empty or whitespace-only input."""
+
+    def test_returns_defaults_for_blank_task(self) -> None:
+        """Test that blank task names produce neutral defaults."""
+        # Arrange
+        task_name = "   "
+
+        # Act
+        analysis = analyze_task_type_and_scope(task_name)
+        patterns = extract_file_patterns(task_name)
+        risks = identify_risks_from_description(task_name)
+        context = generate_context_summary(task_name, "feature")
+
+        # Assert
+        assert analysis == {
+            "type": "feature",
+            "scope": "medium",
+            "complexity": "medium",
+        }
+        assert patterns == []
+        assert risks == []
+        assert "- [ ] None identified yet" in context
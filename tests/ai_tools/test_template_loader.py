@@ -6,6 +6,10 @@ task-specific plan templates.
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from scripts.ai_tools.template_loader import (
@@ -105,6 +109,17 @@ class TestSubstituteVariables:
         )
         assert result == "Start: Build, End: Build"
 
+    def test_values_are_not_substituted_again(self) -> None:
+        """Test that placeholders inside a value are inserted verbatim."""
+        template = "Task: {{task_name}} ({{task_type}})"
+        result = substitute_variables(
+            template,
+            session_id="123",
+            task_name="Fix {{task_type}}",
+            task_type="bugfix",
+        )
+        assert result == "Task: Fix {{task_type}} (bugfix)"
+
     def test_no_variables_returns_unchanged(self) -> None:
         """Test template without variables returns unchanged."""
         template = "This is a plain template"
@@ -205,6 +220,24 @@ class TestLoadTemplate:
         # Should handle special characters properly
         assert "Add email validation & phone verification" in result
 
+    def test_load_template_rereads_modified_file(self, tmp_path: Path) -> None:
+        """Test that an edited template file is not served from the cache."""
+        template_file = tmp_path / "feature.md"
+        template_file.write_text("Old: {{task_name}}")
+        os.utime(template_file, ns=(1_000_000_000, 1_000_000_000))
+
+        with patch(
+            "scripts.ai_tools.template_loader.get_template_path",
+            return_value=template_file,
+        ):
+            first = load_template("feature", session_id="1", task_name="A")
+            template_file.write_text("New: {{task_name}}")
+            os.utime(template_file, ns=(2_000_000_000, 2_000_000_000))
+            second = load_template("feature", session_id="1", task_name="A")
+
+        assert first == "Old: A"
+        assert second == "New: A"
+
     def test_unknown_task_type_raises_error(self) -> None:
         """Test loading unknown task type raises appropriate error."""
         with pytest.raises(TemplateNotFoundError) as exc_info:
@@ -219,6 +252,21 @@ class TestLoadTemplate:
         assert "feature" in error_message.lower()  # Should suggest valid types
 
 
+@pytest.fixture(scope="module")
+def loaded_templates() -> dict[str, str]:
+    """Load every task type's template once for the content tests.
+
+    Returns:
+        Dictionary of task type to loaded template
+    """
+    return {
+        task_type: load_template(
+            task_type=task_type, session_id="123", task_name="Test"
+        )
+        for task_type in ("feature", "bugfix", "docs", "refactor")
+    }
+
+
 class TestTemplateContent:
     """Test that loaded templates have required sections."""
 
@@ -226,9 +274,11 @@ class TestTemplateContent:
         "task_type",
         ["feature", "bugfix", "docs", "refactor"],
     )
-    def test_template_has_required_sections(self, task_type: str) -> None:
+    def test_template_has_required_sections(
+        self, task_type: str, loaded_templates: dict[str, str]
+    ) -> None:
         """Test all templates have required sections."""
-        result = load_template(task_type=task_type, session_id="123", task_name="Test")
+        result = loaded_templates[task_type]
 
         # All templates should have these sections
         required_sections = [
@@ -252,22 +302,22 @@ class TestTemplateContent:
         "task_type",
         ["feature", "bugfix", "docs", "refactor"],
     )
-    def test_template_has_checkboxes(self, task_type: str) -> None:
+    def test_template_has_checkboxes(
+        self, task_type: str, loaded_templates: dict[str, str]
+    ) -> None:
         """Test all templates have checkbox items."""
-        result = load_template(task_type=task_type, session_id="123", task_name="Test")
+        result = loaded_templates[task_type]
 
         # Should have multiple checkbox items
         checkbox_count = result.count("- [ ]")
         assert checkbox_count >= 5, f"Template {task_type} has too few checkboxes"
 
-    def test_templates_are_different(self) -> None:
+    def test_templates_are_different(self, loaded_templates: dict[str, str]) -> None:
         """Test that different task types have different content."""
-        feature = load_template(task_type="feature", session_id="123", task_name="Test")
-        bugfix = load_template(task_type="bugfix", session_id="123", task_name="Test")
-        docs = load_template(task_type="docs", session_id="123", task_name="Test")
-        refactor = load_template(
-            task_type="refactor", session_id="123", task_name="Test"
-        )
+        feature = loaded_templates["feature"]
+        bugfix = loaded_templates["bugfix"]
+        docs = loaded_templates["docs"]
+        refactor = loaded_templates["refactor"]
 
         # Templates should be different
         assert feature != bugfix
@@ -8,7 +8,11 @@ from unittest.mock import patch
 import pytest
 
 from scripts.ai_tools.update_plan import (
+    _iter_lines,
+    _match_checkbox,
+    _parse_plan,
     count_checkboxes,
+    extract_phase_section,
     find_checkbox_line,
     toggle_checkbox,
     update_plan,
@@ -28,6 +32,22 @@ def test_find_checkbox_line() -> None:
     assert "Write test file" in line
 
 
+def test_find_checkbox_line_skips_non_checkbox_matches() -> None:
+    """Test that only checkbox lines match, case-insensitively."""
+    content = """# Plan: Write Tests
+Write tests first.
+- [ ] WRITE TESTS for the parser"""
+    result = find_checkbox_line(content, "write tests")
+    assert result == (2, "- [ ] WRITE TESTS for the parser")
+
+
+def test_find_checkbox_line_does_not_match_across_lines() -> None:
+    """Test that item text spanning a line break never matches."""
+    content = "- [ ] First task\n- [ ] Second task"
+    assert find_checkbox_line(content, "task\n- [ ] Second") is None
+    assert find_checkbox_line(content, "missing") is None
+
+
 def test_toggle_checkbox_check() -> None:
     """Test checking a checkbox."""
     line = "- [ ] Task to do"
@@ -42,6 +62,17 @@ def test_toggle_checkbox_uncheck() -> None:
     assert result == "- [ ] Done task"
 
 
+def test_toggle_checkbox_only_changes_the_box() -> None:
+    """Test that brackets in the item text are left untouched."""
+    assert toggle_checkbox("- [x] Parse [ ] markers", check=True) == (
+        "- [x] Parse [ ] markers"
+    )
+    assert toggle_checkbox("  - [ ] Keep [x] literal", check=True) == (
+        "  - [x] Keep [x] literal"
+    )
+    assert toggle_checkbox("-[x] Tight", check=False) == "-[ ] Tight"
+
+
 def test_count_checkboxes() -> None:
     """Test counting checkboxes."""
     content = """# Plan
@@ -55,6 +86,70 @@ def test_count_checkboxes() -> None:
     assert checked == 2
 
 
+def test_count_checkboxes_only_counts_line_start_boxes() -> None:
+    """Test that boxes count at line starts with any spacing, not mid-line."""
+    content = "- [ ] Parse - [x] markers\n-[x] Tight\n  -  [ ] Loose\nUse - [ ] here"
+    assert count_checkboxes(content) == (1, 3)
+
+
+def test_extract_phase_section() -> None:
+    """Test slicing the phase around a line, from its header to the next."""
+    content = """# Plan
+- [ ] Loose task
+### Phase 1: Tests
+- [ ] Task one
+### Notes
+### Phase 2: Code
+- [ ] Task two
+"""
+    assert extract_phase_section(content, 1) == "# Plan\n- [ ] Loose task"
+    assert extract_phase_section(content, 2) == "### Phase 1: Tests\n- [ ] Task one"
+    assert extract_phase_section(content, 3) == "### Phase 1: Tests\n- [ ] Task one"
+    assert extract_phase_section(content, 6) == "### Phase 2: Code\n- [ ] Task two\n"
+
+
+def test_iter_lines() -> None:
+    """Test iterating lines without a trailing empty line."""
+    assert list(_iter_lines("a\n\nb\n")) == ["a", "", "b"]
+    assert list(_iter_lines("a\nb")) == ["a", "b"]
+    assert list(_iter_lines("")) == []
+
+
+def test_match_checkbox() -> None:
+    """Test matching checkbox prefixes, including unusual spacing."""
+    assert _match_checkbox("- [ ] Task") == (False, 5)
+    assert _match_checkbox("  - [x] Nested") == (True, 7)
+    assert _match_checkbox("-[x] Tight") == (True, 4)
+    assert _match_checkbox("-  [ ] Loose") == (False, 6)
+    assert _match_checkbox("- [X] Capital") is None
+    assert _match_checkbox("- item") is None
+    assert _match_checkbox("### Phase 1") is None
+
+
+def test_parse_plan() -> None:
+    """Test indexing checkboxes and headers in one pass."""
+    content = """# Plan
+### Phase 1: Tests
+- [ ] Task one
+- [x] Task two
+### Notes
+### Phase 2: Code
+  - [x] Nested task
+"""
+    index = _parse_plan(content)
+
+    assert index.lines == content.split("\n")
+    assert index.lower_lines == content.lower().split("\n")
+    assert index.checkboxes == [
+        (2, False, "Task one"),
+        (3, True, "Task two"),
+        (6, True, "Nested task"),
+    ]
+    assert index.phase_starts == [1, 5]
+    assert index.section_starts == [1, 4, 5]
+    assert (index.checked, len(index.checkboxes)) == count_checkboxes(content)
+
+
 def test_update_plan_check_item(
     temp_context_dir: Path, sample_session_files: dict[str, Path]
 ) -> None:
@@ -66,12 +161,90 @@ def test_update_plan_check_item(
             "scripts.ai_tools.utils.get_sessions_dir",
             return_value=temp_context_dir / "sessions",
         ),
-        patch("scripts.ai_tools.update_plan.log_execution"),  # Mock to avoid errors
+        patch("scripts.ai_tools.update_plan.log_execution") as mock_log,
     ):
         update_plan("Identify test cases")
 
     content = plan_file.read_text()
     assert "- [x] Identify test cases" in content
+    # The log goes to the session already resolved, without a second lookup
+    mock_log.assert_called_once_with(
+        "Checked plan item: Identify test cases",
+        level="success",
+        session_id=plan_file.name[:14],
+    )
+
+
+def test_update_plan_check_item_output(
+    temp_context_dir: Path,
+    sample_session_files: dict[str, Path],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that checking an item prints its phase section and progress."""
+    plan_file = sample_session_files["plan"]
+
+    with (
+        patch(
+            "scripts.ai_tools.utils.get_sessions_dir",
+            return_value=temp_context_dir / "sessions",
+        ),
+        patch("scripts.ai_tools.update_plan.log_execution"),
+    ):
+        update_plan("Implement functionality")
+
+    content = plan_file.read_text()
+    line_num = content.split("\n").index("- [x] Implement functionality")
+    captured = capsys.readouterr()
+    assert extract_phase_section(content, line_num) in captured.out
+    assert "Progress: 1/5 items complete (20%)" in captured.out
+
+
+def test_update_plan_skips_write_when_state_unchanged(
+    temp_context_dir: Path,
+    sample_session_files: dict[str, Path],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that unchecking an unchecked item leaves the file untouched."""
+    plan_file = sample_session_files["plan"]
+    before = plan_file.read_text()
+
+    with (
+        patch(
+            "scripts.ai_tools.utils.get_sessions_dir",
+            return_value=temp_context_dir / "sessions",
+        ),
+        patch("scripts.ai_tools.update_plan.log_execution"),
+        patch.object(Path, "write_text") as mock_write,
+    ):
+        update_plan("Implement functionality", check=False, uncheck=True)
+
+    mock_write.assert_not_called()
+    assert plan_file.read_text() == before
+    assert "Progress: 0/5 items complete (0%)" in capsys.readouterr().out
+
+
+def test_update_plan_add_item(
+    temp_context_dir: Path,
+    sample_session_files: dict[str, Path],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test adding an item writes the plan and reports progress."""
+    plan_file = sample_session_files["plan"]
+
+    with (
+        patch(
+            "scripts.ai_tools.utils.get_sessions_dir",
+            return_value=temp_context_dir / "sessions",
+        ),
+        patch("scripts.ai_tools.update_plan.log_execution"),
+    ):
+        update_plan(add="Update the docs", phase="Phase 1")
+
+    content = plan_file.read_text()
+    assert "- [ ] Run tests to confirm they fail\n- [ ] Update the docs\n" in content
+    captured = capsys.readouterr()
+    assert "Added item: Update the docs to Phase 1" in captured.out
+    assert "Progress: 0/6 items complete (0%)" in captured.out
 
 
 def test_update_plan_show(
@@ -202,6 +202,16 @@ class TestRenameItemInPlan:
         result2 = rename_item_in_plan(plan, "Pending old name", "Pending new name")
         assert "- [ ] Pending new name" in result2
 
+    def test_rename_preserves_indentation(self) -> None:
+        """Test that renaming keeps the indentation of nested items."""
+        plan = """### Phase 1: Test
+- [ ] Parent item
+  - [x] Nested old name"""
+
+        result = rename_item_in_plan(plan, "Nested old name", "Nested new name")
+
+        assert "\n  - [x] Nested new name" in result
+
     def test_rename_item_not_found_returns_unchanged(self) -> None:
         """Test that renaming non-existent item returns plan unchanged."""
         plan = """### Phase 1: Test
@@ -313,6 +323,20 @@ Some notes"""
         assert "- [ ] New item 1" in result
         assert "- [ ] New item 2" in result
 
+    def test_add_phase_inserts_lines_in_order(self) -> None:
+        """Test that the header, items and blank line land as one block."""
+        plan = """### Phase 1: Test
+- [ ] Item 1
+
+## Notes"""
+
+        result = add_phase_to_plan(plan, "Phase 2: Build", items=["A", "B"])
+
+        assert result == (
+            "### Phase 1: Test\n- [ ] Item 1\n\n"
+            "### Phase 2: Build\n- [ ] A\n- [ ] B\n\n## Notes"
+        )
+
     def test_add_phase_maintains_plan_structure(self) -> None:
         """Test that adding phase maintains overall plan structure."""
         plan = """# Task Plan: Test
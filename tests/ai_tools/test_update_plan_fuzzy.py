@@ -7,6 +7,10 @@ better error messages with suggestions, and validation features.
 from __future__ import annotations
 
 from scripts.ai_tools.update_plan import (
+    _build_pattern_masks,
+    _find_similar_cached,
+    _myers_distance,
+    _normalized_checkbox_items,
     calculate_levenshtein_distance,
     find_similar_items,
     validate_no_duplicates,
@@ -48,6 +52,26 @@ class TestLevenshteinDistance:
         """Test that distance calculation is case sensitive."""
         assert calculate_levenshtein_distance("Test", "test") == 1
 
+    def test_shared_prefix_and_suffix(self) -> None:
+        """Test that shared prefixes and suffixes do not affect the distance."""
+        assert calculate_levenshtein_distance("run tsets now", "run tests now") == 2
+        assert calculate_levenshtein_distance("aaa", "aaaa") == 1
+        assert calculate_levenshtein_distance("abcab", "ab") == 3
+
+    def test_strings_longer_than_a_machine_word(self) -> None:
+        """Test distance for strings longer than 64 characters."""
+        assert calculate_levenshtein_distance("a" * 100, "b" * 100) == 100
+        assert calculate_levenshtein_distance("x" * 70 + "y", "y" + "x" * 70) == 2
+        assert calculate_levenshtein_distance("ab" * 40, "ba" * 40) == 2
+
+    def test_max_distance_stops_early(self) -> None:
+        """Test that a cutoff returns a bound above it, or the exact distance."""
+        masks = _build_pattern_masks("abcdef")
+
+        assert _myers_distance(masks, 6, "abcxef", max_distance=2) == 1
+        assert _myers_distance(masks, 6, "uvwxyz", max_distance=2) > 2
+        assert _myers_distance(masks, 6, "uvwxyz", max_distance=2) <= 6
+
 
 class TestFindSimilarItems:
     """Test finding similar items using fuzzy matching."""
@@ -116,6 +140,59 @@ class TestFindSimilarItems:
         result = find_similar_items("test", [], threshold=0.6)
         assert result == []
 
+    def test_length_difference_at_threshold_is_kept(self) -> None:
+        """Test that items whose length gap exactly meets threshold still match."""
+        # "abcxy" -> "abc" is 2 deletions over 5 characters: similarity 0.6
+        result = find_similar_items("abcxy", ["abc", "a"], threshold=0.6)
+
+        assert [item for item, _ in result] == ["abc"]
+
+    def test_fuzzy_score_matches_levenshtein_distance(self) -> None:
+        """Test that fuzzy scores agree with calculate_levenshtein_distance."""
+        target = "Implment the login flow"
+        items = ["Implement login flow", "implement the logout flow", "Login"]
+
+        result = dict(find_similar_items(target, items, threshold=0.0))
+
+        for item in items:
+            distance = calculate_levenshtein_distance(target.lower(), item.lower())
+            max_len = max(len(target), len(item))
+            assert result[item] == 1.0 - (distance / max_len)
+
+    def test_character_prefilter_keeps_close_matches(self) -> None:
+        """Test that the character prefilter drops unrelated items, not typos."""
+        items = ["deploy api", "xyz qqq wv", "deploy apps"]
+        result = find_similar_items("deplyo api", items, threshold=0.6)
+
+        assert [item for item, _ in result] == ["deploy api", "deploy apps"]
+
+    def test_limit_returns_top_results_in_order(self) -> None:
+        """Test that limit keeps only the best matches, ties in input order."""
+        items = ["test b", "format", "test a", "test", "tests"]
+
+        full = find_similar_items("test", items, threshold=0.5)
+        limited = find_similar_items("test", items, threshold=0.5, limit=3)
+
+        assert limited == full[:3]
+        assert [item for item, _ in limited] == ["test", "tests", "test b"]
+
+    def test_repeated_lookup_is_cached(self) -> None:
+        """Test that repeating a lookup reuses the ranking but not the list."""
+        _find_similar_cached.cache_clear()
+        items = ["Run tests", "Write tests", "Format code"]
+
+        first = find_similar_items("Run tsets", items, threshold=0.5)
+        first.clear()
+        second = find_similar_items("Run tsets", items, threshold=0.5)
+
+        assert second
+        assert _find_similar_cached.cache_info().hits == 1
+
+    def test_empty_strings(self) -> None:
+        """Test that empty targets and items score without dividing by zero."""
+        assert find_similar_items("", [""], threshold=0.6) == [("", 1.0)]
+        assert find_similar_items("test", [""], threshold=0.6) == []
+
     def test_partial_word_matching(self) -> None:
         """Test matching partial words."""
         items = ["Run make check", "Run make format", "Run tests"]
@@ -193,3 +270,14 @@ class TestValidateNoDuplicates:
         """Test validation with empty plan."""
         result = validate_no_duplicates("", "New item")
         assert result is None  # No duplicates in empty plan
+
+    def test_repeated_checks_reuse_normalized_items(self) -> None:
+        """Test that checks against an unchanged plan normalize it once."""
+        _normalized_checkbox_items.cache_clear()
+        plan = """### Phase 1: Test
+- [ ] Item 1
+- [x] Item 2"""
+
+        assert validate_no_duplicates(plan, "item  2") is not None
+        assert validate_no_duplicates(plan, "Item 3") is None
+        assert _normalized_checkbox_items.cache_info().misses == 1
@@ -0,0 +1,25 @@
+"""Tests for AI tools shared utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.ai_tools.utils import get_current_session, get_session_files
+
+
+@pytest.mark.parametrize("kind", ["missing", "file"])
+def test_unreadable_sessions_dir_means_no_sessions(tmp_path: Path, kind: str) -> None:
+    """Test that a missing sessions path, or a file in its place, has no sessions."""
+    sessions_dir = tmp_path / "sessions"
+    if kind == "file":
+        sessions_dir.write_text("not a directory", encoding="utf-8")
+
+    with patch("scripts.ai_tools.utils.get_sessions_dir", return_value=sessions_dir):
+        session_id = get_current_session()
+        files = get_session_files("20251103120000")
+
+    assert session_id is None
+    assert files == {"plan": None, "summary": None, "execution": None}
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import tomllib
 from pathlib import Path
+from unittest.mock import patch
 
 from scripts.quality.config import (
+    get_code_files,
     get_code_paths,
     get_min_coverage,
     get_project_root,
@@ -84,3 +87,42 @@ def test_load_quality_config_handles_missing_file() -> None:
     config = load_quality_config()
     assert config is not None
     assert isinstance(config, dict)
+
+
+def test_load_quality_config_parses_pyproject_once() -> None:
+    """Test that repeated loads reuse the parsed configuration."""
+    load_quality_config.cache_clear()
+
+    with patch("scripts.quality.config.tomllib.load", wraps=tomllib.load) as mock_load:
+        first = load_quality_config()
+        get_code_paths()
+        get_test_paths()
+        get_min_coverage()
+
+    assert mock_load.call_count == 1
+    assert load_quality_config() is first
+
+
+def test_get_code_paths_returns_copy() -> None:
+    """Test that mutating returned paths does not affect the cached config."""
+    paths = get_code_paths()
+    paths.append("not-a-real-path")
+
+    assert "not-a-real-path" not in get_code_paths()
+
+
+def test_get_code_files_lists_python_files() -> None:
+    """Test that get_code_files returns Python files under the code paths."""
+    files = get_code_files()
+
+    assert files
+    assert all(path.endswith(".py") for path in files)
+    assert any(path.startswith("tests") for path in files)
+
+
+def test_get_code_files_returns_copy() -> None:
+    """Test that mutating the returned files does not affect the cache."""
+    files = get_code_files()
+    files.append("not-a-real-file.py")
+
+    assert "not-a-real-file.py" not in get_code_files()
@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
-from scripts.quality.lint import lint_code, main
+import pytest
+
+from scripts.quality.config import get_project_root
+from scripts.quality.lint import _MAX_FILE_ARGS, lint_code, main
+
+
+@pytest.fixture(autouse=True)
+def no_code_files() -> Iterator[MagicMock]:
+    """Make lint_code fall back to the (mocked) code paths by default."""
+    with patch("scripts.quality.lint.get_code_files", return_value=[]) as mock:
+        yield mock
 
 
 @patch("scripts.quality.lint.subprocess.run")
@@ -12,14 +23,14 @@ from scripts.quality.lint import lint_code, main
 def test_lint_code_runs_all_linters(
     mock_get_paths: MagicMock, mock_run: MagicMock
 ) -> None:
-    """Test that lint_code runs ruff, mypy, and pylint."""
+    """Test that lint_code runs ruff and mypy."""
     mock_get_paths.return_value = ["src", "tests"]
     mock_run.return_value = MagicMock(returncode=0)
 
     result = lint_code(fix=False)
 
     assert result == 0
-    assert mock_run.call_count == 3
+    assert mock_run.call_count == 2
 
     # Verify ruff was called
     ruff_call = mock_run.call_args_list[0]
@@ -34,11 +45,54 @@ def test_lint_code_runs_all_linters(
     assert "src" in mypy_call[0][0]
     assert "tests" in mypy_call[0][0]
 
-    # Verify pylint was called
-    pylint_call = mock_run.call_args_list[2]
-    assert "pylint" in pylint_call[0][0]
-    assert "src" in pylint_call[0][0]
-    assert "tests" in pylint_call[0][0]
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_pins_mypy_cache_to_project_root(
+    mock_get_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that mypy reuses one cache directory under the project root."""
+    mock_get_paths.return_value = ["src"]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    lint_code(fix=False)
+
+    mypy_args = mock_run.call_args_list[1][0][0]
+    cache_dir = mypy_args[mypy_args.index("--cache-dir") + 1]
+    assert cache_dir == str(get_project_root() / ".mypy_cache")
+    assert "--sqlite-cache" in mypy_args
+
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_flushes_banner_before_each_linter(
+    mock_get_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that "Running:" lines are flushed before the linter writes."""
+    mock_get_paths.return_value = ["src"]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    with patch("builtins.print") as mock_print:
+        lint_code(fix=False)
+
+    banners = [call for call in mock_print.call_args_list if "Running:" in str(call)]
+    assert len(banners) == 2
+    assert all(call.kwargs.get("flush") for call in banners)
+
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_does_not_spawn_pylint(
+    mock_get_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that pylint rules come from ruff rather than a pylint process."""
+    mock_get_paths.return_value = ["src"]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    lint_code(fix=False)
+
+    commands = [call[0][0][0] for call in mock_run.call_args_list]
+    assert "pylint" not in commands
 
 
 @patch("scripts.quality.lint.subprocess.run")
@@ -103,7 +157,7 @@ def test_lint_code_stops_on_ruff_failure(
 
     result = lint_code(fix=False)
 
-    # Should only call ruff, not mypy or pylint
+    # Should only call ruff, not mypy
     assert mock_run.call_count == 1
     assert result == 1
 
@@ -119,11 +173,84 @@ def test_lint_code_continues_through_all_on_success(
 
     result = lint_code(fix=False)
 
-    # Should call all three linters
-    assert mock_run.call_count == 3
+    # Should call both linters
+    assert mock_run.call_count == 2
     assert result == 0
 
 
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_reports_mypy_failure(
+    mock_get_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that a mypy failure is reported after ruff passes."""
+    mock_get_paths.return_value = ["src"]
+
+    def fake_run(args: list[str], **_: object) -> MagicMock:
+        code = 2 if args[0] == "mypy" else 0
+        return MagicMock(returncode=code, stdout="", stderr="")
+
+    mock_run.side_effect = fake_run
+
+    result = lint_code(fix=False)
+
+    assert result == 2
+    assert mock_run.call_count == 2
+
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_passes_collected_files(
+    mock_get_paths: MagicMock, mock_run: MagicMock, no_code_files: MagicMock
+) -> None:
+    """Test that ruff gets the pre-walked file list."""
+    mock_get_paths.return_value = ["src"]
+    no_code_files.return_value = ["src/a.py", "src/b.py"]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    lint_code(fix=False)
+
+    ruff_args = mock_run.call_args_list[0][0][0]
+    assert ruff_args[-2:] == ["src/a.py", "src/b.py"]
+    assert "src" not in ruff_args
+
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_never_passes_files_to_mypy(
+    mock_get_paths: MagicMock, mock_run: MagicMock, no_code_files: MagicMock
+) -> None:
+    """Test that mypy-excluded files never reach the mypy command line."""
+    mock_get_paths.return_value = ["scripts"]
+    no_code_files.return_value = [
+        "scripts/ai_tools/check_conflicts.py",
+        "scripts/quality/lint.py",
+    ]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    lint_code(fix=False)
+
+    mypy_args = mock_run.call_args_list[1][0][0]
+    assert mypy_args[-1] == "scripts"
+    assert "scripts/ai_tools/check_conflicts.py" not in mypy_args
+
+
+@patch("scripts.quality.lint.subprocess.run")
+@patch("scripts.quality.lint.get_code_paths")
+def test_lint_code_falls_back_to_paths_for_long_file_lists(
+    mock_get_paths: MagicMock, mock_run: MagicMock, no_code_files: MagicMock
+) -> None:
+    """Test that very long file lists are replaced by the directories."""
+    mock_get_paths.return_value = ["src"]
+    no_code_files.return_value = [f"src/m{i}.py" for i in range(_MAX_FILE_ARGS + 1)]
+    mock_run.return_value = MagicMock(returncode=0)
+
+    lint_code(fix=False)
+
+    for call in mock_run.call_args_list:
+        assert call[0][0][-1] == "src"
+
+
 @patch("scripts.quality.lint.lint_code")
 @patch("sys.argv", ["lint.py"])
 def test_main_without_arguments(mock_lint: MagicMock) -> None:
@@ -0,0 +1,77 @@
+"""Tests for quality.__main__ module."""
+
+from __future__ import annotations
+
+import sys
+import tomllib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.quality.__main__ import COMMANDS, main
+from scripts.quality.config import get_project_root
+
+
+@patch("sys.argv", ["python -m scripts.quality"])
+@patch("scripts.quality.lint.main")
+def test_main_dispatches_to_selected_tool(mock_lint: MagicMock) -> None:
+    """Test that the named tool's main() runs and its exit code is returned."""
+    mock_lint.return_value = 3
+
+    exit_code = main(["lint"])
+
+    assert exit_code == 3
+    mock_lint.assert_called_once_with()
+
+
+@patch("sys.argv", ["python -m scripts.quality"])
+@patch("scripts.quality.lint.main")
+def test_main_forwards_remaining_arguments(mock_lint: MagicMock) -> None:
+    """Test that tool options reach the tool as its own command line."""
+    seen: list[str] = []
+
+    def record_argv() -> int:
+        seen.extend(sys.argv)
+        return 0
+
+    mock_lint.side_effect = record_argv
+
+    main(["lint", "--fix"])
+
+    assert seen == ["quality-lint", "--fix"]
+
+
+@patch("sys.argv", ["python -m scripts.quality"])
+@patch("scripts.quality.test.main")
+def test_main_forwards_short_options(mock_test: MagicMock) -> None:
+    """Test that options the dispatcher does not know are passed through."""
+    seen: list[str] = []
+
+    def record_argv() -> int:
+        seen.extend(sys.argv)
+        return 0
+
+    mock_test.side_effect = record_argv
+
+    main(["test", "-n", "4", "--coverage"])
+
+    assert seen == ["quality-test", "-n", "4", "--coverage"]
+
+
+def test_main_rejects_unknown_command() -> None:
+    """Test that an unknown command exits with a usage error."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["deploy"])
+
+    assert exc_info.value.code == 2
+
+
+def test_commands_match_console_scripts() -> None:
+    """Test that every quality-* console script has a subcommand."""
+    pyproject = get_project_root() / "pyproject.toml"
+    scripts = tomllib.loads(pyproject.read_text(encoding="utf-8"))["project"]["scripts"]
+    quality_scripts = {
+        name.removeprefix("quality-") for name in scripts if name.startswith("quality-")
+    }
+
+    assert set(COMMANDS) == quality_scripts
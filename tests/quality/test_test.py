@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from scripts.quality.test import main, run_tests
+from scripts.quality.test import _parse_workers, main, run_tests
 
 
 @patch("scripts.quality.test.subprocess.run")
@@ -48,6 +48,7 @@ def test_run_tests_with_coverage(
     assert "--cov-report=term-missing" in call_args
     assert "--cov-report=html" in call_args
     assert "--cov-fail-under=80" in call_args
+    mock_coverage.assert_called_once_with()
 
 
 @patch("scripts.quality.test.subprocess.run")
@@ -85,6 +86,50 @@ def test_run_tests_returns_failure(
     assert result == 1
 
 
+@patch("scripts.quality.test.subprocess.run")
+@patch("scripts.quality.test.get_test_paths")
+@patch("scripts.quality.test.get_min_coverage")
+def test_run_tests_uses_xdist_by_default(
+    mock_coverage: MagicMock, mock_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that run_tests spreads test files over xdist workers."""
+    mock_paths.return_value = ["tests"]
+    mock_coverage.return_value = 80
+    mock_run.return_value = MagicMock(returncode=0)
+
+    run_tests(coverage=True, verbose=False)
+
+    call_args = mock_run.call_args[0][0]
+    assert call_args[call_args.index("-n") + 1] == "auto"
+    assert "--dist=loadfile" in call_args
+
+
+@patch("scripts.quality.test.subprocess.run")
+@patch("scripts.quality.test.get_test_paths")
+@patch("scripts.quality.test.get_min_coverage")
+def test_run_tests_serial(
+    mock_coverage: MagicMock, mock_paths: MagicMock, mock_run: MagicMock
+) -> None:
+    """Test that run_tests runs in one process when workers is None."""
+    mock_paths.return_value = ["tests"]
+    mock_coverage.return_value = 80
+    mock_run.return_value = MagicMock(returncode=0)
+
+    run_tests(coverage=False, verbose=False, workers=None)
+
+    call_args = mock_run.call_args[0][0]
+    assert "-n" not in call_args
+    assert "--dist=loadfile" not in call_args
+
+
+def test_parse_workers() -> None:
+    """Test worker selection from command-line arguments."""
+    assert _parse_workers(["test.py"]) == "auto"
+    assert _parse_workers(["test.py", "-n", "4"]) == "4"
+    assert _parse_workers(["test.py", "--serial"]) is None
+    assert _parse_workers(["test.py", "-n"]) == "auto"
+
+
 @patch("scripts.quality.test.run_tests")
 @patch("sys.argv", ["test.py"])
 def test_main_default_flags(mock_tests: MagicMock) -> None:
@@ -94,7 +139,7 @@ def test_main_default_flags(mock_tests: MagicMock) -> None:
     exit_code = main()
 
     assert exit_code == 0
-    mock_tests.assert_called_once_with(coverage=False, verbose=False)
+    mock_tests.assert_called_once_with(coverage=False, verbose=False, workers="auto")
 
 
 @patch("scripts.quality.test.run_tests")
@@ -106,7 +151,7 @@ def test_main_with_coverage_flag(mock_tests: MagicMock) -> None:
     exit_code = main()
 
     assert exit_code == 0
-    mock_tests.assert_called_once_with(coverage=True, verbose=False)
+    mock_tests.assert_called_once_with(coverage=True, verbose=False, workers="auto")
 
 
 @patch("scripts.quality.test.run_tests")
@@ -118,7 +163,7 @@ def test_main_with_verbose_flag(mock_tests: MagicMock) -> None:
     exit_code = main()
 
     assert exit_code == 0
-    mock_tests.assert_called_once_with(coverage=False, verbose=True)
+    mock_tests.assert_called_once_with(coverage=False, verbose=True, workers="auto")
 
 
 @patch("scripts.quality.test.run_tests")
@@ -130,4 +175,16 @@ def test_main_with_multiple_flags(mock_tests: MagicMock) -> None:
     exit_code = main()
 
     assert exit_code == 0
-    mock_tests.assert_called_once_with(coverage=True, verbose=True)
+    mock_tests.assert_called_once_with(coverage=True, verbose=True, workers="auto")
+
+
+@patch("scripts.quality.test.run_tests")
+@patch("sys.argv", ["test.py", "--serial"])
+def test_main_with_serial_flag(mock_tests: MagicMock) -> None:
+    """Test main with serial flag disables xdist."""
+    mock_tests.return_value = 0
+
+    exit_code = main()
+
+    assert exit_code == 0
+    mock_tests.assert_called_once_with(coverage=False, verbose=False, workers=None)
@@ -23,6 +23,7 @@ def test_dev_dependency_versions_are_realistic() -> None:
         "pytest>=8.4.2",
         "pytest-cov>=7.0.0",
         "pytest-mock>=3.15.1",
+        "pytest-xdist>=3.8.0",
         "ruff>=0.14.3",
     ]
 